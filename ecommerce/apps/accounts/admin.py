@@ -1,5 +1,8 @@
+import uuid
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import transaction
+from apps.accounts import constants
 from apps.accounts.models import (
     User,
     AdminProfile,
@@ -9,6 +12,11 @@ from apps.accounts.models import (
     UserSession,
     AuditLog,
 )
+from apps.accounts.pagination import FasterAdminPaginator
+from apps.accounts.services import AuditService
+from apps.accounts.services.session_cache import SessionCacheService
+from apps.accounts.tasks import send_bulk_verification_emails
+from apps.common.utils import update_returning
 
 
 class AdminProfileInline(admin.StackedInline):
@@ -53,7 +61,7 @@ class UserAdmin(BaseUserAdmin):
     )
     search_fields = ("email", "phone")
     ordering = ("-created_at",)
-    actions = ["verify_emails"]
+    actions = ["verify_emails", "resend_verification_emails"]
 
     fieldsets = (
         (None, {"fields": ("email", "password")}),
@@ -99,24 +107,87 @@ class UserAdmin(BaseUserAdmin):
 
     readonly_fields = ("last_login", "created_at", "updated_at")
 
+    # Columns loaded for the changelist; keep in sync with list_display
+    changelist_only_fields = (
+        "email",
+        "phone",
+        "role",
+        "email_verified",
+        "is_active",
+        "is_staff",
+        "created_at",
+    )
+
+    # Each role has exactly one profile model to edit inline
+    profile_inline_for_role = {
+        User.Role.ADMIN: AdminProfileInline,
+        User.Role.CUSTOMER: CustomerProfileInline,
+        User.Role.SHOPKEEPER: ShopKeeperProfileInline,
+    }
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # The change form needs every field, so only narrow the changelist
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith("_changelist"):
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+
     def get_inline_instances(self, request, obj=None):
         if not obj:
             return []
 
-        inlines = []
-        if obj.role == User.Role.ADMIN:
-            inlines.append(AdminProfileInline(self.model, self.admin_site))
-        elif obj.role == User.Role.CUSTOMER:
-            inlines.append(CustomerProfileInline(self.model, self.admin_site))
-        elif obj.role == User.Role.SHOPKEEPER:
-            inlines.append(ShopKeeperProfileInline(self.model, self.admin_site))
+        inline_class = self.profile_inline_for_role.get(obj.role)
+        if inline_class is None:
+            return []
+        return [inline_class(self.model, self.admin_site)]
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Match an email or E164 phone prefix instead of the default icontains.
 
-        return inlines
+        LIKE '%q%' can never use an index. Emails are stored lower-cased and
+        phones in E164 format, so a term that looks like either ("name@..."
+        or "+digits") is first matched by case-sensitive prefix. On
+        PostgreSQL that is served by the varchar_pattern_ops ("_like") index
+        Django's schema editor creates for unique and indexed varchar
+        columns. When the prefix matches nothing (e.g. "smith@" for
+        "john.smith@x.com"), and for any other term (names, domains, local
+        phone numbers), the default substring search is used.
+        """
+        search_term = search_term.strip()
+        prefix_match = None
+        if "@" in search_term and not search_term.startswith("@"):
+            prefix_match = queryset.filter(email__startswith=search_term.lower())
+        elif search_term.startswith("+") and search_term[1:].isdigit():
+            prefix_match = queryset.filter(phone__startswith=search_term)
+        if prefix_match is not None and prefix_match.exists():
+            return prefix_match, False
+        return super().get_search_results(request, queryset, search_term)
 
     @admin.action(description="Verify selected users' emails")
     def verify_emails(self, request, queryset):
-        count = queryset.update(email_verified=True)
-        self.message_user(request, f"{count} user(s) verified successfully.")
+        with transaction.atomic():
+            verified = update_returning(
+                queryset.filter(email_verified=False), ("pk",), email_verified=True
+            )
+            AuditService.log_admin_action(
+                constants.AUDIT_ACTION_EMAIL_VERIFICATION,
+                request,
+                [(user_id, None) for user_id, in verified],
+            )
+        self.message_user(request, f"{len(verified)} user(s) verified successfully.")
+
+    @admin.action(description="Resend verification emails to selected users")
+    def resend_verification_emails(self, request, queryset):
+        user_ids = list(
+            queryset.filter(email_verified=False).values_list("pk", flat=True)
+        )
+        if user_ids:
+            send_bulk_verification_emails(user_ids)
+        self.message_user(
+            request, f"Verification email queued for {len(user_ids)} user(s)."
+        )
 
 
 @admin.register(AdminProfile)
@@ -124,6 +195,7 @@ class AdminProfileAdmin(admin.ModelAdmin):
     list_display = ("user", "department", "created_at")
     search_fields = ("user__email", "department")
     readonly_fields = ("created_at", "updated_at")
+    list_select_related = ("user",)
 
 
 @admin.register(CustomerProfile)
@@ -131,6 +203,7 @@ class CustomerProfileAdmin(admin.ModelAdmin):
     list_display = ("user", "full_name", "created_at")
     search_fields = ("user__email", "full_name")
     readonly_fields = ("created_at", "updated_at")
+    list_select_related = ("user",)
 
 
 @admin.register(ShopKeeperProfile)
@@ -140,20 +213,53 @@ class ShopKeeperProfileAdmin(admin.ModelAdmin):
     search_fields = ("user__email", "shop_name", "gst_number")
     readonly_fields = ("created_at", "updated_at")
     actions = ["verify_shops"]
+    list_select_related = ("user",)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Look up a full GST number through its unique index."""
+        search_term = search_term.strip()
+        if len(search_term) == constants.GST_NUMBER_LENGTH and search_term.isalnum():
+            gst_numbers = {search_term, search_term.upper()}
+            return queryset.filter(gst_number__in=gst_numbers), False
+        return super().get_search_results(request, queryset, search_term)
 
     @admin.action(description="Verify selected shops")
     def verify_shops(self, request, queryset):
-        count = queryset.update(is_verified=True)
-        self.message_user(request, f"{count} shop(s) verified successfully.")
+        with transaction.atomic():
+            verified = update_returning(
+                queryset.filter(is_verified=False), ("user_id",), is_verified=True
+            )
+            AuditService.log_admin_action(
+                constants.AUDIT_ACTION_PROFILE_UPDATE,
+                request,
+                [
+                    (user_id, {"changes": {"is_verified": True}})
+                    for user_id, in verified
+                ],
+            )
+        self.message_user(request, f"{len(verified)} shop(s) verified successfully.")
 
 
 @admin.register(EmailVerificationToken)
 class EmailVerificationTokenAdmin(admin.ModelAdmin):
-    list_display = ("user", "token", "created_at", "expires_at", "is_used")
+    list_display = ("user", "token_prefix", "created_at", "expires_at", "is_used")
     list_filter = ("is_used", "created_at")
     search_fields = ("user__email",)
     readonly_fields = ("token", "created_at", "expires_at")
     ordering = ("-created_at",)
+    list_select_related = ("user",)
+
+    @admin.display(description="Token")
+    def token_prefix(self, obj):
+        return f"{str(obj.token)[:8]}…"
+
+    def get_search_results(self, request, queryset, search_term):
+        """Look up a full token through its unique index."""
+        try:
+            token = uuid.UUID(search_term.strip())
+        except ValueError:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(token=token), False
 
 
 @admin.register(UserSession)
@@ -167,14 +273,30 @@ class UserSessionAdmin(admin.ModelAdmin):
     )
     list_filter = ("is_active", "created_at")
     search_fields = ("user__email", "ip_address")
-    readonly_fields = ("session_key", "created_at", "last_activity")
+    readonly_fields = ("session_key", "user_agent", "created_at", "last_activity")
     ordering = ("-last_activity",)
     actions = ["invalidate_sessions"]
+    show_full_result_count = False
+    list_select_related = ("user",)
 
     @admin.action(description="Invalidate selected sessions")
     def invalidate_sessions(self, request, queryset):
-        count = queryset.update(is_active=False)
-        self.message_user(request, f"{count} session(s) invalidated successfully.")
+        with transaction.atomic():
+            revoked = update_returning(
+                queryset.filter(is_active=True), ("pk", "user_id"), is_active=False
+            )
+            AuditService.log_admin_action(
+                constants.AUDIT_ACTION_SESSION_REVOKED,
+                request,
+                [
+                    (user_id, {"session_id": str(session_id)})
+                    for session_id, user_id in revoked
+                ],
+            )
+            SessionCacheService.forget(*{user_id for _, user_id in revoked})
+        self.message_user(
+            request, f"{len(revoked)} session(s) invalidated successfully."
+        )
 
 
 @admin.register(AuditLog)
@@ -191,6 +313,9 @@ class AuditLogAdmin(admin.ModelAdmin):
         "created_at",
     )
     ordering = ("-created_at",)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_select_related = ("user",)
 
     def has_add_permission(self, request):
         # Prevent manual creation of audit logs
@@ -6,5 +6,8 @@ class AccountsConfig(AppConfig):
     name = "apps.accounts"
 
     def ready(self):
-        """Import signals when Django starts"""
+        """Import signals and start the audit log writer when Django starts"""
         import apps.accounts.signals.user  # noqa: F401
+        from apps.common.utils import start_queue_logging
+
+        start_queue_logging("security")
@@ -24,9 +24,34 @@ EMAIL_VERIFICATION_SENT = "Verification email sent"
 EMAIL_LINK_EXPIRED = "This verification link has expired"
 EMAIL_LINK_USED = "This verification link has already been used"
 EMAIL_LINK_INVALID = "Invalid verification link"
+EMAIL_TASK_MAX_RETRIES = 3
+EMAIL_BATCH_SIZE = 100  # Emails sent per SMTP connection in bulk sends
+
+# Token cache (used/expired tokens rejected without a DB query)
+DEAD_TOKEN_CACHE_PREFIX = "dead_token"
+DEAD_TOKEN_CACHE_TIMEOUT = 60 * 60 * 24
+TOKEN_KIND_EMAIL_VERIFICATION = "verify"
+TOKEN_KIND_PASSWORD_RESET = "reset"
+TOKEN_KIND_EMAIL_CHANGE = "email_change"
+
+# Password reset requests (at most one per email address per cooldown)
+PASSWORD_RESET_COOLDOWN_CACHE_PREFIX = "password_reset_cooldown"
+PASSWORD_RESET_COOLDOWN_SECONDS = 60
+
+# Active session counts (login limit checked without a COUNT query)
+ACTIVE_SESSION_CACHE_PREFIX = "active_sessions"
+ACTIVE_SESSION_CACHE_TIMEOUT = 60 * 60
+
+# Token cleanup (expired tokens are purged after the retention period)
+TOKEN_RETENTION_DAYS = 30
+TOKEN_PURGE_BATCH_SIZE = 10000
+
+# Session cleanup (revoked sessions are purged after the retention period)
+SESSION_RETENTION_DAYS = 30
+SESSION_PURGE_BATCH_SIZE = 5000
 
 # Email Templates
-# Use {variable} for placeholders that will be replaced with .format()
+# Use {variable} for placeholders; rendered via utils.PrecompiledTemplate
 EMAIL_VERIFICATION_TEMPLATE = """
 Hi {email},
 
@@ -111,11 +136,18 @@ GST_HELP_TEXT = "GST registration number ({length} characters)"
 
 # Phone
 PHONE_HELP_TEXT = "Phone number in international format (e.g., +919876543210)"
+PHONE_NORMALIZE_CACHE_SIZE = 4096
 
 # Session
 SESSION_REVOKED_SUCCESS = "Session invalidated successfully"
 SESSION_NOT_FOUND = "Session not found or already inactive"
 SESSIONS_REVOKED_COUNT = "{count} session(s) revoked successfully"
+# Minimum seconds between last_activity writes for the same session
+SESSION_ACTIVITY_UPDATE_INTERVAL = 60
+# Digest bytes identifying a deduplicated user agent string
+USER_AGENT_HASH_SIZE = 16
+# Digest bytes of the refresh token stored as a session's key (hex encoded)
+SESSION_KEY_HASH_SIZE = 16
 
 # API Messages
 LEGACY_ENDPOINT_WARNING = (
@@ -134,6 +166,8 @@ DEFAULT_MAX_ACTIVE_SESSIONS_PER_USER = 5
 
 # Admin
 ADMIN_LIST_PER_PAGE = 25
+# Below this many rows an exact COUNT(*) is cheap enough for admin pagination
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 10000
 
 # Audit Log Actions
 # (These match the AuditLog.Action choices)
@@ -144,6 +178,13 @@ AUDIT_ACTION_PASSWORD_CHANGE = "PASSWORD_CHANGE"
 AUDIT_ACTION_EMAIL_VERIFICATION = "EMAIL_VERIFICATION"
 AUDIT_ACTION_ACCOUNT_CREATED = "ACCOUNT_CREATED"
 AUDIT_ACTION_SESSION_REVOKED = "SESSION_REVOKED"
+AUDIT_ACTION_PROFILE_UPDATE = "PROFILE_UPDATE"
+
+# Rows per INSERT when writing audit logs in bulk
+AUDIT_LOG_BULK_BATCH_SIZE = 500
+
+# Retries for queued audit log writes hitting transient database errors
+AUDIT_TASK_MAX_RETRIES = 3
 
 # Authentication
 
@@ -4,6 +4,7 @@ Enhanced Field Validators for Accounts App
 Custom field classes with built-in validation for reuse across serializers.
 """
 
+from functools import cache
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from apps.accounts import constants
@@ -12,7 +13,37 @@ from apps.accounts.validators import (
     validate_password_strength,
     validate_phone_number,
 )
-from apps.accounts.models import User
+
+# Validators are stateless (UniqueValidator clones its queryset per call), so
+# build them once and share them across field instances.
+_PASSWORD_VALIDATORS = (validate_password_strength,)
+_GST_VALIDATORS = (validate_gst_number,)
+
+
+@cache
+def _email_validators():
+    # Import lazily so importing serializers does not resolve the User model
+    from apps.accounts.models import User
+
+    return (
+        UniqueValidator(
+            queryset=User.objects.all(),
+            message="A user with this email already exists.",
+        ),
+    )
+
+
+@cache
+def _phone_validators():
+    from apps.accounts.models import User
+
+    return (
+        validate_phone_number,
+        UniqueValidator(
+            queryset=User.objects.all(),
+            message="A user with this phone number already exists.",
+        ),
+    )
 
 
 class PasswordField(serializers.CharField):
@@ -22,7 +53,7 @@ class PasswordField(serializers.CharField):
         kwargs.setdefault("write_only", True)
         kwargs.setdefault("style", {"input_type": "password"})
         kwargs.setdefault("help_text", constants.PASSWORD_HELP_TEXT)
-        kwargs.setdefault("validators", []).append(validate_password_strength)
+        kwargs["validators"] = [*kwargs.get("validators", ()), *_PASSWORD_VALIDATORS]
         super().__init__(**kwargs)
 
 
@@ -45,7 +76,7 @@ class GSTNumberField(serializers.CharField):
             "help_text",
             constants.GST_HELP_TEXT.format(length=constants.GST_NUMBER_LENGTH),
         )
-        kwargs.setdefault("validators", []).append(validate_gst_number)
+        kwargs["validators"] = [*kwargs.get("validators", ()), *_GST_VALIDATORS]
         super().__init__(**kwargs)
 
 
@@ -73,13 +104,7 @@ class EmailField(serializers.EmailField):
     def __init__(self, **kwargs):
         kwargs.setdefault("help_text", "Email address (must be unique)")
         # Add unique validator to catch duplicates at serializer level
-        validators = kwargs.setdefault("validators", [])
-        validators.append(
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="A user with this email already exists.",
-            )
-        )
+        kwargs["validators"] = [*kwargs.get("validators", ()), *_email_validators()]
         super().__init__(**kwargs)
 
 
@@ -88,14 +113,6 @@ class PhoneField(serializers.CharField):
 
     def __init__(self, **kwargs):
         kwargs.setdefault("help_text", constants.PHONE_HELP_TEXT)
-        # Add phone number validator
-        validators = kwargs.setdefault("validators", [])
-        validators.append(validate_phone_number)
-        # Add unique validator to catch duplicates at serializer level
-        validators.append(
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="A user with this phone number already exists.",
-            )
-        )
+        # Add phone number and unique validators
+        kwargs["validators"] = [*kwargs.get("validators", ()), *_phone_validators()]
         super().__init__(**kwargs)
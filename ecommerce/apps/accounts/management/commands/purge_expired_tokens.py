@@ -0,0 +1,49 @@
+"""
+Purge Expired Tokens Command
+
+Deletes email verification, password reset and email change tokens that
+expired more than TOKEN_RETENTION_DAYS ago, keeping the token tables and
+their indexes small. Celery beat runs the same purge hourly through
+purge_expired_tokens_task, one subtask per token table.
+"""
+
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.accounts import constants
+from apps.accounts.models import (
+    EmailChangeToken,
+    EmailVerificationToken,
+    PasswordResetToken,
+)
+
+TOKEN_MODELS = (EmailVerificationToken, PasswordResetToken, EmailChangeToken)
+
+
+class Command(BaseCommand):
+    help = "Delete tokens that expired before the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=constants.TOKEN_RETENTION_DAYS,
+            help="Keep tokens that expired within this many days",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=constants.TOKEN_PURGE_BATCH_SIZE,
+            help="Maximum rows deleted per statement",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+
+        for model in TOKEN_MODELS:
+            deleted = model.objects.purge_expired(cutoff, options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[OK] Deleted {deleted} {model._meta.verbose_name_plural}"
+                )
+            )
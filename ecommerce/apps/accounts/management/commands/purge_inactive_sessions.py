@@ -0,0 +1,37 @@
+"""
+Purge Inactive Sessions Command
+
+Deletes revoked or evicted sessions whose last activity is more than
+SESSION_RETENTION_DAYS ago, so the session table does not grow with every
+login. Runs hourly via Celery beat.
+"""
+
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.accounts import constants
+from apps.accounts.models import UserSession
+
+
+class Command(BaseCommand):
+    help = "Delete inactive sessions older than the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=constants.SESSION_RETENTION_DAYS,
+            help="Keep inactive sessions last used within this many days",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=constants.SESSION_PURGE_BATCH_SIZE,
+            help="Maximum rows deleted per statement",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+
+        deleted = UserSession.objects.purge_inactive(cutoff, options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"[OK] Deleted {deleted} sessions"))
@@ -1,5 +1,54 @@
+import hashlib
+from functools import lru_cache
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
 import phonenumbers
+from apps.accounts import constants
+
+
+def _delete_in_batches(queryset, batch_size):
+    """
+    Delete the rows of a queryset in primary-key batches.
+
+    Batching keeps each DELETE short so it never holds locks across the
+    whole table. Each batch is a single DELETE ... WHERE pk IN (SELECT ...
+    LIMIT n), issued without the deletion collector, so only use this for
+    models with no dependents or delete signals. The batches are unordered
+    so the subquery can walk an index on the filtered column.
+
+    Returns:
+        Number of rows deleted
+    """
+    pending = queryset.order_by().values("pk")
+    model = queryset.model
+    total = 0
+    while True:
+        batch = model._base_manager.filter(pk__in=pending[:batch_size])
+        deleted = batch._raw_delete(queryset.db)
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+@lru_cache(maxsize=constants.PHONE_NORMALIZE_CACHE_SIZE)
+def _e164(phone):
+    """
+    Format a phone number as E164, or return it unchanged if invalid.
+
+    Cached because phonenumbers parsing is CPU-heavy and the same raw
+    value is often normalized repeatedly (retries, lookups, fixtures).
+    """
+    try:
+        parsed = phonenumbers.parse(phone, None)
+        if phonenumbers.is_valid_number(parsed):
+            return phonenumbers.format_number(
+                parsed, phonenumbers.PhoneNumberFormat.E164
+            )
+    except phonenumbers.NumberParseException:
+        pass
+    return phone
 
 
 class UserManager(BaseUserManager):
@@ -8,17 +57,24 @@ class UserManager(BaseUserManager):
         Normalize phone number to E164 format if possible.
         Falls back to original value if parsing fails.
         """
-        try:
-            parsed = phonenumbers.parse(phone, None)
-            if phonenumbers.is_valid_number(parsed):
-                return phonenumbers.format_number(
-                    parsed, phonenumbers.PhoneNumberFormat.E164
-                )
-        except phonenumbers.NumberParseException:
-            pass
-        return phone
-
-    def create_user(self, email, phone, role, password=None):
+        return _e164(phone)
+
+    def light(self):
+        """
+        Users without the password hash, for read paths that never check it.
+
+        Accessing the password on these instances still works; it costs one
+        extra query to load the deferred column.
+        """
+        return self.defer("password")
+
+    def create_user(
+        self, email, phone, role, password=None, profile_data=None, **extra_fields
+    ):
+        """
+        Create a user; profile_data is passed on to the role profile that the
+        post_save signal inserts, so it is written in the same INSERT.
+        """
         if not email:
             raise ValueError("Email is required")
 
@@ -26,15 +82,101 @@ class UserManager(BaseUserManager):
         email = self.normalize_email(email).lower()
         phone = self._normalize_phone(phone)
 
-        user = self.model(email=email, phone=phone, role=role)
+        user = self.model(email=email, phone=phone, role=role, **extra_fields)
         user.set_password(password)
+        user._profile_data = profile_data or {}
         user.save(using=self._db)
         return user
 
-    def create_superuser(self, email, phone, role, password=None):
-        user = self.create_user(email=email, phone=phone, role=role, password=password)
-        user.is_staff = True
-        user.is_superuser = True
-        user.email_verified = True  # Auto-verify superuser email
-        user.save()
-        return user
+    def create_superuser(self, email, phone, role, password=None, **extra_fields):
+        extra_fields.setdefault("is_staff", True)
+        extra_fields.setdefault("is_superuser", True)
+        extra_fields.setdefault("email_verified", True)  # Auto-verify superuser email
+        return self.create_user(
+            email=email, phone=phone, role=role, password=password, **extra_fields
+        )
+
+
+class TokenQuerySet(models.QuerySet):
+    """QuerySet for single-use, expiring tokens."""
+
+    def valid(self):
+        """Tokens that are unused and not yet expired, checked in SQL."""
+        return self.filter(is_used=False, expires_at__gt=timezone.now())
+
+    def purge_expired(self, before, batch_size):
+        """
+        Delete tokens that expired before a cutoff, in primary-key batches.
+
+        Args:
+            before: Tokens with expires_at earlier than this are deleted
+            batch_size: Maximum rows deleted per statement
+
+        Returns:
+            Number of tokens deleted
+        """
+        return _delete_in_batches(self.filter(expires_at__lt=before), batch_size)
+
+
+class EmailChangeTokenQuerySet(TokenQuerySet):
+    def valid(self):
+        """Also require that the user's email has not changed since the request."""
+        return super().valid().filter(current_email=F("user__email"))
+
+
+class UserSessionQuerySet(models.QuerySet):
+    """QuerySet for login sessions."""
+
+    def purge_inactive(self, before, batch_size):
+        """
+        Delete revoked sessions last active before a cutoff, in batches.
+
+        User agents left without any session are deleted afterwards, so
+        client-chosen headers cannot grow the lookup table without bound.
+
+        Args:
+            before: Inactive sessions with last_activity earlier than this are deleted
+            batch_size: Maximum rows deleted per statement
+
+        Returns:
+            Number of sessions deleted
+        """
+        deleted = _delete_in_batches(
+            self.filter(is_active=False, last_activity__lt=before), batch_size
+        )
+        user_agent_model = self.model._meta.get_field("user_agent").related_model
+        user_agent_model.objects.purge_unused(batch_size)
+        return deleted
+
+
+class UserAgentManager(models.Manager):
+    @staticmethod
+    def hash_text(text):
+        """Fixed-size digest used as the lookup key for a user agent string."""
+        return hashlib.blake2b(
+            text.encode(), digest_size=constants.USER_AGENT_HASH_SIZE
+        ).digest()
+
+    def intern(self, text):
+        """
+        Return the shared row for a user agent string, creating it if needed.
+
+        Sessions reference these rows instead of each storing the full
+        header, which repeats across most logins.
+        """
+        user_agent, _ = self.get_or_create(
+            ua_hash=self.hash_text(text), defaults={"text": text}
+        )
+        return user_agent
+
+    def purge_unused(self, batch_size):
+        """
+        Delete user agents no session references any more, in batches.
+
+        Args:
+            batch_size: Maximum rows deleted per statement
+
+        Returns:
+            Number of user agents deleted
+        """
+        return _delete_in_batches(self.filter(sessions__isnull=True), batch_size)
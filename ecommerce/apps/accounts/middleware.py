@@ -0,0 +1,26 @@
+"""
+Accounts Middleware
+
+Request-scoped hooks for the accounts app.
+"""
+
+from apps.accounts.services import AuditService
+
+
+class AuditLogBufferMiddleware:
+    """
+    Write the audit entries deferred during a request with one INSERT.
+
+    AuditService buffers committed entries on the request; they are
+    flushed here once the view (and its transaction) has finished.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request._pending_audit_logs = []
+        try:
+            return self.get_response(request)
+        finally:
+            AuditService.flush_deferred(request)
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_alter_usersession_session_key"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["-created_at"], name="accounts_au_created_721afe_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-16 09:45
+
+from django.db import migrations
+
+INDEX_NAME = "accounts_au_metadata_gin_idx"
+
+
+def create_metadata_gin_index(apps, schema_editor):
+    # GIN/jsonb_path_ops is PostgreSQL-only; other backends keep a plain table
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        "ON accounts_auditlog USING gin (metadata jsonb_path_ops)"
+    )
+
+
+def drop_metadata_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_auditlog_created_at_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_metadata_gin_index, drop_metadata_gin_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-16 10:40
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0010_auditlog_user_created_at_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="emailchangetoken",
+            name="accounts_em_token_8a4942_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="emailverificationtoken",
+            name="accounts_em_token_629d48_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="passwordresettoken",
+            name="accounts_pa_token_861566_idx",
+        ),
+        migrations.AlterField(
+            model_name="emailchangetoken",
+            name="token",
+            field=models.UUIDField(default=uuid.uuid4, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="emailverificationtoken",
+            name="token",
+            field=models.UUIDField(default=uuid.uuid4, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="passwordresettoken",
+            name="token",
+            field=models.UUIDField(default=uuid.uuid4, unique=True),
+        ),
+    ]
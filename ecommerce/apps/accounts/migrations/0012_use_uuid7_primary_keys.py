@@ -0,0 +1,114 @@
+# Generated by Django 6.0 on 2026-10-16 10:05
+
+import apps.common.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0011_drop_redundant_token_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="adminprofile",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="auditlog",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="customerprofile",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailchangetoken",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailverificationtoken",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="passwordresettoken",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="shopkeeperprofile",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="socialaccount",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usersession",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
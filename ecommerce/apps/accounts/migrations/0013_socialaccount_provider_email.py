@@ -0,0 +1,56 @@
+# Generated by Django 6.0 on 2026-10-16 10:20
+
+from django.db import migrations, models
+
+GIN_INDEX_NAME = "social_extra_data_gin_idx"
+
+
+def backfill_provider_email(apps, schema_editor):
+    SocialAccount = apps.get_model("accounts", "SocialAccount")
+    accounts = SocialAccount.objects.filter(extra_data__has_key="email")
+    for account in accounts.iterator():
+        account.provider_email = account.extra_data.get("email") or None
+        account.save(update_fields=["provider_email"])
+
+
+def create_extra_data_gin_index(apps, schema_editor):
+    # GIN/jsonb_path_ops is PostgreSQL-only; other backends keep a plain table
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {GIN_INDEX_NAME} "
+        "ON accounts_socialaccount USING gin (extra_data jsonb_path_ops)"
+    )
+
+
+def drop_extra_data_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0012_use_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="socialaccount",
+            name="provider_email",
+            field=models.EmailField(
+                blank=True, editable=False, max_length=254, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_provider_email, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="socialaccount",
+            index=models.Index(
+                condition=models.Q(("provider_email__isnull", False)),
+                fields=["provider_email"],
+                name="social_provider_email_idx",
+            ),
+        ),
+        migrations.RunPython(create_extra_data_gin_index, drop_extra_data_gin_index),
+    ]
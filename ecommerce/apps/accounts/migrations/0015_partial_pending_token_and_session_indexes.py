@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0014_created_at_db_default"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="emailchangetoken",
+            name="accounts_em_user_id_73868f_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="passwordresettoken",
+            name="accounts_pa_user_id_023f8d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="usersession",
+            name="accounts_us_user_id_91ed82_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="usersession",
+            name="accounts_us_session_221e03_idx",
+        ),
+        migrations.AddIndex(
+            model_name="emailchangetoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["user"],
+                name="ect_user_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="passwordresettoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["user"],
+                name="prt_user_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usersession",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user"],
+                name="session_user_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 6.0 on 2026-10-16 11:20
+
+import hashlib
+
+import apps.common.utils
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def intern_session_user_agents(apps, schema_editor):
+    UserAgent = apps.get_model("accounts", "UserAgent")
+    UserSession = apps.get_model("accounts", "UserSession")
+    texts = UserSession.objects.values_list("user_agent", flat=True).distinct()
+    for text in texts.iterator():
+        user_agent, _ = UserAgent.objects.get_or_create(
+            ua_hash=hashlib.blake2b(text.encode(), digest_size=16).digest(),
+            defaults={"text": text},
+        )
+        UserSession.objects.filter(user_agent=text).update(user_agent_ref=user_agent)
+
+
+def restore_session_user_agents(apps, schema_editor):
+    UserSession = apps.get_model("accounts", "UserSession")
+    for session in UserSession.objects.select_related("user_agent_ref").iterator():
+        session.user_agent = session.user_agent_ref.text
+        session.save(update_fields=["user_agent"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0015_partial_pending_token_and_session_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAgent",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=apps.common.utils.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "ua_hash",
+                    models.BinaryField(editable=False, max_length=16, unique=True),
+                ),
+                ("text", models.TextField(blank=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="usersession",
+            name="user_agent_ref",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="sessions",
+                to="accounts.useragent",
+            ),
+        ),
+        migrations.RunPython(intern_session_user_agents, restore_session_user_agents),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-16 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from 0016 so the schema change runs in its own transaction;
+    # PostgreSQL refuses to ALTER a table with pending deferred FK checks
+
+    dependencies = [
+        ("accounts", "0016_useragent"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="usersession",
+            name="user_agent",
+        ),
+        migrations.RenameField(
+            model_name="usersession",
+            old_name="user_agent_ref",
+            new_name="user_agent",
+        ),
+        migrations.AlterField(
+            model_name="usersession",
+            name="user_agent",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="sessions",
+                to="accounts.useragent",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-16 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0017_usersession_user_agent_fk"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="usersession",
+            name="session_user_active_idx",
+        ),
+        migrations.AddIndex(
+            model_name="usersession",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "created_at"],
+                name="session_active_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-16 18:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0018_usersession_active_created_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailverificationtoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["user"],
+                name="evt_user_pending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-16 18:27
+
+import hashlib
+
+from django.db import migrations
+
+
+def hash_session_keys(apps, schema_editor):
+    UserSession = apps.get_model("accounts", "UserSession")
+    sessions = UserSession.objects.only("session_key")
+    for session in sessions.iterator():
+        session.session_key = hashlib.blake2b(
+            session.session_key.encode(), digest_size=16
+        ).hexdigest()
+        session.save(update_fields=["session_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0019_emailverificationtoken_pending_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(hash_session_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-16 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0020_hash_session_keys"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="usersession",
+            name="session_key",
+            field=models.CharField(max_length=32, unique=True),
+        ),
+    ]
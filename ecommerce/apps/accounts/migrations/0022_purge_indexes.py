@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-16 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0021_usersession_session_key_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailchangetoken",
+            index=models.Index(fields=["expires_at"], name="ect_expires_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="emailverificationtoken",
+            index=models.Index(fields=["expires_at"], name="evt_expires_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="passwordresettoken",
+            index=models.Index(fields=["expires_at"], name="prt_expires_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="usersession",
+            index=models.Index(
+                condition=models.Q(("is_active", False)),
+                fields=["last_activity"],
+                name="session_inactive_activity_idx",
+            ),
+        ),
+    ]
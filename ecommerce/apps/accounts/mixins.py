@@ -8,27 +8,30 @@ from typing import Any
 from django.db import transaction
 from rest_framework.response import Response
 from rest_framework import status
-from apps.accounts.services import EmailService, AuditService
+from apps.accounts.services import AuditService
+from apps.accounts.tasks import send_verification_email_task
 from apps.accounts import constants
-from apps.accounts.serializer_mixins import PasswordConfirmationMixin  # noqa: F401
 
 
 class EmailVerificationMixin:
     """
-    Mixin to automatically send verification email after user creation.
+    Mixin to automatically queue a verification email after user creation.
 
     Automatically called in create() method of CreateAPIView.
     """
 
     def send_verification_email(self, user) -> None:
         """
-        Send verification email to user after transaction commits.
+        Queue verification email for user after transaction commits.
 
         Args:
             user: User instance to send email to
         """
-        # Use on_commit to ensure email is only sent if DB transaction succeeds
-        transaction.on_commit(lambda: EmailService.send_verification_email(user))
+        # Use on_commit to ensure email is only queued if DB transaction succeeds;
+        # the worker does the SMTP round trip so the response is not blocked
+        transaction.on_commit(
+            lambda user_id=user.pk: send_verification_email_task.delay(user_id)
+        )
 
 
 class AuditLoggingMixin:
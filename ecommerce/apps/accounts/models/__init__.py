@@ -6,6 +6,7 @@ from .social_account import SocialAccount
 from .email_verification_token import EmailVerificationToken
 from .password_reset_token import PasswordResetToken
 from .email_change_token import EmailChangeToken
+from .user_agent import UserAgent
 from .user_session import UserSession
 from .audit_log import AuditLog
 
@@ -18,6 +19,7 @@ __all__ = [
     "EmailVerificationToken",
     "PasswordResetToken",
     "EmailChangeToken",
+    "UserAgent",
     "UserSession",
     "AuditLog",
 ]
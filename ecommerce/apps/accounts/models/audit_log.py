@@ -1,5 +1,6 @@
-import uuid
 from django.db import models
+from django.db.models.functions import Now
+from apps.common.utils import uuid7
 from .user import User
 
 
@@ -31,7 +32,7 @@ class AuditLog(models.Model):
             "Two-Factor Authentication Disabled",
         )
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -43,13 +44,18 @@ class AuditLog(models.Model):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
     metadata = models.JSONField(default=dict, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["user", "action", "-created_at"]),
+            # Matches the default ordering so recent-first listings (admin
+            # changelist) are an index scan instead of a sort of the table
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["action", "-created_at"]),
+            # metadata has a GIN (jsonb_path_ops) index on PostgreSQL for
+            # metadata__contains lookups; see migration 0009
         ]
 
     def __str__(self):
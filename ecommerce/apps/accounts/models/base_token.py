@@ -0,0 +1,56 @@
+"""
+Base Token Model
+
+Shared fields and behaviour for single-use, expiring tokens.
+"""
+
+import uuid
+from datetime import timedelta
+from django.db import models
+from django.db.models.functions import Now
+from apps.common.utils import uuid7
+from django.utils import timezone
+from apps.accounts.managers import TokenQuerySet
+
+
+class BaseToken(models.Model):
+    """
+    Abstract base for email verification, password reset and email change
+    tokens. Subclasses add the user foreign key and set EXPIRY_HOURS.
+    """
+
+    EXPIRY_HOURS = 24
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # unique=True gives token lookups their own index
+    token = models.UUIDField(default=uuid.uuid4, unique=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    expires_at = models.DateTimeField()
+    is_used = models.BooleanField(default=False)
+
+    objects = TokenQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        ordering = ["-created_at"]
+
+    def save(self, *args, **kwargs):
+        if not self.expires_at:
+            self.expires_at = timezone.now() + timedelta(hours=self.EXPIRY_HOURS)
+        super().save(*args, **kwargs)
+
+    def is_valid(self) -> bool:
+        """Check if token is still valid (not used and not expired)."""
+        return not self.is_used and timezone.now() < self.expires_at
+
+    def mark_as_used(self) -> bool:
+        """
+        Mark token as used with a single conditional UPDATE.
+
+        Returns True if this call consumed the token, False if it was
+        already used.
+        """
+        self.is_used = True
+        return bool(
+            type(self).objects.filter(pk=self.pk, is_used=False).update(is_used=True)
+        )
@@ -4,14 +4,13 @@ Email Change Token Model
 Stores tokens for email change verification.
 """
 
-import uuid
-from datetime import timedelta
 from django.db import models
-from django.utils import timezone
+from apps.accounts.managers import EmailChangeTokenQuerySet
+from .base_token import BaseToken
 from .user import User
 
 
-class EmailChangeToken(models.Model):
+class EmailChangeToken(BaseToken):
     """
     Model to store email change verification tokens.
 
@@ -24,28 +23,28 @@ class EmailChangeToken(models.Model):
 
     EXPIRY_HOURS = 24
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="email_change_tokens"
     )
-    token = models.UUIDField(default=uuid.uuid4, unique=True, db_index=True)
     current_email = models.EmailField(help_text="User's email at time of request")
     new_email = models.EmailField(help_text="The new email address to verify")
-    created_at = models.DateTimeField(auto_now_add=True)
-    expires_at = models.DateTimeField()
-    is_used = models.BooleanField(default=False)
 
-    class Meta:
-        ordering = ["-created_at"]
+    objects = EmailChangeTokenQuerySet.as_manager()
+
+    class Meta(BaseToken.Meta):
         indexes = [
-            models.Index(fields=["token", "is_used"]),
-            models.Index(fields=["user", "is_used"]),
+            # Pending tokens only; used tokens are never looked up by user
+            models.Index(
+                fields=["user"],
+                name="ect_user_pending_idx",
+                condition=models.Q(is_used=False),
+            ),
             models.Index(fields=["new_email"]),
+            # Range scans for the expired token purge
+            models.Index(fields=["expires_at"], name="ect_expires_idx"),
         ]
 
     def save(self, *args, **kwargs):
-        if not self.expires_at:
-            self.expires_at = timezone.now() + timedelta(hours=self.EXPIRY_HOURS)
         # Store current email at time of request
         if not self.current_email:
             self.current_email = self.user.email
@@ -53,16 +52,18 @@ class EmailChangeToken(models.Model):
 
     def is_valid(self) -> bool:
         """Check if token is still valid."""
-        return (
-            not self.is_used
-            and timezone.now() < self.expires_at
-            and self.user.email == self.current_email  # Email hasn't changed since
-        )
+        return super().is_valid() and self._email_unchanged()
+
+    def _email_unchanged(self) -> bool:
+        """
+        Check the user's email still matches the one snapshotted at request.
 
-    def mark_as_used(self) -> None:
-        """Mark token as used."""
-        self.is_used = True
-        self.save(update_fields=["is_used"])
+        Uses the loaded user when it was fetched with select_related;
+        otherwise checks by user_id instead of loading the whole row.
+        """
+        if EmailChangeToken.user.is_cached(self):
+            return self.user.email == self.current_email
+        return User.objects.filter(pk=self.user_id, email=self.current_email).exists()
 
     def __str__(self):
         return f"Email change token: {self.current_email} -> {self.new_email}"
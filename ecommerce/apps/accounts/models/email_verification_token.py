@@ -1,48 +1,32 @@
-import uuid
-from datetime import timedelta
 from django.db import models
-from django.utils import timezone
 from apps.accounts import constants
+from .base_token import BaseToken
 from .user import User
 
 
-class EmailVerificationToken(models.Model):
+class EmailVerificationToken(BaseToken):
     """
     Model to store email verification tokens.
     Tokens expire after 24 hours by default.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    EXPIRY_HOURS = constants.EMAIL_VERIFICATION_EXPIRY_HOURS
+
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="verification_tokens"
     )
-    token = models.UUIDField(default=uuid.uuid4, unique=True, db_index=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    expires_at = models.DateTimeField()
-    is_used = models.BooleanField(default=False)
 
-    class Meta:
-        ordering = ["-created_at"]
+    class Meta(BaseToken.Meta):
         indexes = [
-            models.Index(fields=["token", "is_used"]),
+            # Pending tokens only; resend deletes a user's unused tokens
+            models.Index(
+                fields=["user"],
+                name="evt_user_pending_idx",
+                condition=models.Q(is_used=False),
+            ),
+            # Range scans for the expired token purge
+            models.Index(fields=["expires_at"], name="evt_expires_idx"),
         ]
 
-    def save(self, *args, **kwargs):
-        # Set expiration to 24 hours from creation if not set
-        if not self.expires_at:
-            self.expires_at = timezone.now() + timedelta(
-                hours=constants.EMAIL_VERIFICATION_EXPIRY_HOURS
-            )
-        super().save(*args, **kwargs)
-
-    def is_valid(self):
-        """Check if token is still valid (not used and not expired)"""
-        return not self.is_used and timezone.now() < self.expires_at
-
-    def mark_as_used(self):
-        """Mark token as used"""
-        self.is_used = True
-        self.save(update_fields=["is_used"])
-
     def __str__(self):
         return f"Verification token for {self.user.email}"
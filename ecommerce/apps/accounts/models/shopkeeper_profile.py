@@ -1,11 +1,11 @@
-import uuid
 from django.db import models
+from apps.common.utils import uuid7
 from .user import User
 from apps.common.models import TimeStampedModel
 
 
 class ShopKeeperProfile(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     shop_name = models.CharField(max_length=255)
     gst_number = models.CharField(max_length=15, unique=True, null=True, blank=True)
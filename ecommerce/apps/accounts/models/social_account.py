@@ -1,19 +1,37 @@
-import uuid
 from django.db import models
+from apps.common.utils import uuid7
 from .user import User
 
 
 class SocialAccount(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="social_accounts"
     )
     provider = models.CharField(max_length=50)  # e.g., 'google', 'facebook'
     uid = models.CharField(max_length=255)
     extra_data = models.JSONField(default=dict)
+    # Copied from extra_data["email"] on save so it can be looked up by index
+    provider_email = models.EmailField(null=True, blank=True, editable=False)
 
     class Meta:
         unique_together = ("provider", "uid")
+        indexes = [
+            models.Index(
+                fields=["provider_email"],
+                name="social_provider_email_idx",
+                condition=models.Q(provider_email__isnull=False),
+            ),
+            # extra_data has a GIN (jsonb_path_ops) index on PostgreSQL for
+            # extra_data__contains lookups; see migration 0013
+        ]
+
+    def save(self, *args, **kwargs):
+        self.provider_email = (self.extra_data or {}).get("email") or None
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "extra_data" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "provider_email"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.user.email} - {self.provider}"
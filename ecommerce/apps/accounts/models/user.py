@@ -1,5 +1,5 @@
-import uuid
 from django.db import models
+from apps.common.utils import uuid7
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from apps.accounts.managers import UserManager
 from apps.accounts.validators import validate_phone_number
@@ -13,7 +13,7 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
         SHOPKEEPER = "SHOPKEEPER", "ShopKeeper"
         CUSTOMER = "CUSTOMER", "Customer"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True, db_index=True)
     phone = models.CharField(
         max_length=constants.PHONE_MAX_LENGTH,
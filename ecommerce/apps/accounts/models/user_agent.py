@@ -0,0 +1,24 @@
+from django.db import models
+from apps.accounts import constants
+from apps.accounts.managers import UserAgentManager
+from apps.common.utils import uuid7
+
+
+class UserAgent(models.Model):
+    """
+    Deduplicated User-Agent header.
+
+    Sessions reference one row per distinct string instead of repeating
+    the full header on every login.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    ua_hash = models.BinaryField(
+        max_length=constants.USER_AGENT_HASH_SIZE, unique=True, editable=False
+    )
+    text = models.TextField(blank=True)
+
+    objects = UserAgentManager()
+
+    def __str__(self):
+        return self.text
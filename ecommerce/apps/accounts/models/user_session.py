@@ -1,6 +1,12 @@
-import uuid
+import hashlib
+from datetime import timedelta
 from django.db import models
+from apps.common.utils import uuid7
+from django.utils import timezone
+from apps.accounts import constants
+from apps.accounts.managers import UserSessionQuerySet
 from .user import User
+from .user_agent import UserAgent
 
 
 class UserSession(models.Model):
@@ -9,30 +15,70 @@ class UserSession(models.Model):
     Allows users to view and revoke active sessions.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="sessions")
-    session_key = models.CharField(max_length=512, unique=True, db_index=True)
+    # Hex digest of the refresh token (see key_for_token), not the JWT itself
+    session_key = models.CharField(
+        max_length=constants.SESSION_KEY_HASH_SIZE * 2, unique=True
+    )
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    user_agent = models.TextField(blank=True)
+    user_agent = models.ForeignKey(
+        UserAgent, on_delete=models.PROTECT, related_name="sessions"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     last_activity = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    objects = UserSessionQuerySet.as_manager()
+
     class Meta:
         ordering = ["-last_activity"]
         indexes = [
-            models.Index(fields=["user", "is_active"]),
-            models.Index(fields=["session_key", "is_active"]),
+            # Active sessions only, oldest first for limit eviction;
+            # session_key lookups use its unique index
+            models.Index(
+                fields=["user", "created_at"],
+                name="session_active_created_idx",
+                condition=models.Q(is_active=True),
+            ),
+            # Revoked sessions only, by age for the inactive session purge
+            models.Index(
+                fields=["last_activity"],
+                name="session_inactive_activity_idx",
+                condition=models.Q(is_active=False),
+            ),
         ]
 
+    @staticmethod
+    def key_for_token(refresh_token):
+        """Fixed-size session key derived from a refresh token"""
+        return hashlib.blake2b(
+            refresh_token.encode(), digest_size=constants.SESSION_KEY_HASH_SIZE
+        ).hexdigest()
+
     def invalidate(self):
-        """Mark session as inactive"""
+        """Mark session as inactive with a single conditional UPDATE"""
         self.is_active = False
-        self.save(update_fields=["is_active"])
+        return bool(
+            UserSession.objects.filter(pk=self.pk, is_active=True).update(
+                is_active=False
+            )
+        )
 
     def update_activity(self):
-        """Update last activity timestamp (auto_now handles the value)"""
-        self.save(update_fields=["last_activity"])
+        """
+        Bump last activity, at most once per SESSION_ACTIVITY_UPDATE_INTERVAL.
+
+        update() bypasses auto_now, so the timestamp is set explicitly.
+        """
+        now = timezone.now()
+        interval = timedelta(seconds=constants.SESSION_ACTIVITY_UPDATE_INTERVAL)
+        updated = UserSession.objects.filter(
+            pk=self.pk, last_activity__lt=now - interval
+        ).update(last_activity=now)
+        if updated:
+            self.last_activity = now
+        return bool(updated)
 
     def __str__(self):
         return f"Session for {self.user.email} from {self.ip_address}"
@@ -4,6 +4,9 @@ Pagination Classes for Accounts App
 Custom pagination configurations for different endpoint types.
 """
 
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from apps.accounts import constants
 
@@ -42,3 +45,32 @@ class SessionPagination(PageNumberPagination):
     page_size = constants.SESSION_PAGE_SIZE
     page_size_query_param = "page_size"
     max_page_size = constants.MAX_PAGE_SIZE
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Admin paginator that avoids COUNT(*) on large unfiltered tables.
+
+    On PostgreSQL an unfiltered changelist uses the planner's row estimate
+    from pg_class instead of scanning the whole table. Filtered or searched
+    querysets, other databases and small tables use the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+
+        if connection.vendor == "postgresql" and not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [query.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+
+            # reltuples is -1 for tables that were never analyzed
+            if row and row[0] >= constants.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+                return row[0]
+
+        return super().count
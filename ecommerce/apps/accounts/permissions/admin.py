@@ -6,6 +6,10 @@ Permission classes for admin-only access.
 
 from rest_framework.permissions import BasePermission
 from apps.accounts.models import User
+from .base import get_user_role
+
+# Plain str values, so checks are a str compare rather than an enum lookup
+ROLE_ADMIN = User.Role.ADMIN.value
 
 
 class IsAdmin(BasePermission):
@@ -19,11 +23,7 @@ class IsAdmin(BasePermission):
     message = "Only administrators can access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and request.user.role == User.Role.ADMIN
-        )
+        return get_user_role(request) == ROLE_ADMIN
 
 
 class IsAdminOrReadOnly(BasePermission):
@@ -37,13 +37,11 @@ class IsAdminOrReadOnly(BasePermission):
     message = "Only administrators can modify this resource."
 
     def has_permission(self, request, view):
+        role = get_user_role(request)
+
         # Read permissions for any authenticated request
         if request.method in ("GET", "HEAD", "OPTIONS"):
-            return request.user and request.user.is_authenticated
+            return role is not None
 
         # Write permissions only for admin
-        return (
-            request.user
-            and request.user.is_authenticated
-            and request.user.role == User.Role.ADMIN
-        )
+        return role == ROLE_ADMIN
@@ -7,6 +7,23 @@ Common permission classes used across apps.
 from rest_framework.permissions import BasePermission
 
 
+def get_user_role(request):
+    """
+    Return the authenticated user's role, or None for anonymous requests.
+
+    The result is memoized on the request, so stacked role permissions
+    resolve request.user and its authentication state only once. The memo
+    is read from the instance itself: DRF's Request proxies missing
+    attributes to the wrapped HttpRequest, whose user may differ.
+    """
+    try:
+        return vars(request)["_user_role"]
+    except KeyError:
+        user = request.user
+        request._user_role = user.role if user and user.is_authenticated else None
+        return request._user_role
+
+
 class IsEmailVerified(BasePermission):
     """
     Only allow access to users with verified email.
@@ -6,6 +6,10 @@ Permission classes for customer access control.
 
 from rest_framework.permissions import BasePermission
 from apps.accounts.models import User
+from .base import get_user_role
+
+# Plain str value, so the check is a str compare rather than an enum lookup
+ROLE_CUSTOMER = User.Role.CUSTOMER.value
 
 
 class IsCustomer(BasePermission):
@@ -19,11 +23,7 @@ class IsCustomer(BasePermission):
     message = "Only customers can access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and request.user.role == User.Role.CUSTOMER
-        )
+        return get_user_role(request) == ROLE_CUSTOMER
 
 
 # Note: IsOrderOwner and IsReviewOwner permissions are handled via:
@@ -4,10 +4,35 @@ Reusable Mixins for Serializers
 DRY principle: Extract common serializer logic into reusable mixins.
 """
 
+from copy import copy
 from typing import Dict, Any
 from rest_framework import serializers
 from apps.accounts import constants
 
+# Unbound field templates per serializer class, filled by CachedFieldsMixin
+_FIELDS_CACHE: Dict[type, Dict[str, serializers.Field]] = {}
+
+
+class CachedFieldsMixin:
+    """
+    Mixin to build a serializer's fields once per class.
+
+    ModelSerializer.get_fields() introspects the model and deep-copies every
+    declared field on each instantiation. This keeps the first result as an
+    unbound template and hands each instance shallow copies, which bind
+    independently.
+
+    Only for serializers whose fields do not depend on instance or context.
+    """
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        cls = type(self)
+        try:
+            template = _FIELDS_CACHE[cls]
+        except KeyError:
+            template = _FIELDS_CACHE[cls] = super().get_fields()
+        return {name: copy(field) for name, field in template.items()}
+
 
 class PasswordConfirmationMixin:
     """
@@ -20,6 +45,18 @@ class PasswordConfirmationMixin:
     password_field = "password"
     confirm_field = "password_confirm"
 
+    # Whether a class after this mixin in the MRO defines validate();
+    # resolved once per subclass instead of on every validate() call
+    _has_super_validate = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        mro = cls.__mro__
+        cls._has_super_validate = any(
+            "validate" in vars(base)
+            for base in mro[mro.index(PasswordConfirmationMixin) + 1 :]
+        )
+
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate that password and password_confirm match.
@@ -33,16 +70,15 @@ class PasswordConfirmationMixin:
         Raises:
             ValidationError: If passwords don't match
         """
-        password = attrs.get(self.password_field)
-        password_confirm = attrs.pop(self.confirm_field, None)
-
-        if password and password_confirm and password != password_confirm:
-            raise serializers.ValidationError(
-                {self.confirm_field: constants.PASSWORD_MISMATCH_ERROR}
-            )
-
-        # Call parent validate if exists
-        if hasattr(super(), "validate"):
+        if self.confirm_field in attrs:
+            password_confirm = attrs.pop(self.confirm_field)
+            password = attrs.get(self.password_field)
+            if password and password_confirm and password != password_confirm:
+                raise serializers.ValidationError(
+                    {self.confirm_field: constants.PASSWORD_MISMATCH_ERROR}
+                )
+
+        if self._has_super_validate:
             attrs = super().validate(attrs)
 
         return attrs
@@ -1,5 +1,7 @@
+from django.contrib.auth.models import update_last_login
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 from apps.accounts.models import User
 
 
@@ -12,16 +14,20 @@ class LoginSerializer(TokenObtainPairSerializer):
     - Invalid password (email exists but wrong password)
     - Inactive account
 
-    Optimized to minimize database queries.
+    Optimized to minimize database queries: the user is fetched once with
+    only the columns needed here, and authenticate() is not called again.
     """
 
+    # Columns needed to check credentials and issue tokens
+    login_fields = ("id", "email", "password", "is_active", "role")
+
     def validate(self, attrs):
         email = attrs.get("email", "")
         password = attrs.get("password", "")
 
-        # Check if user exists (Query 1)
+        # Check if user exists (the only query)
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.only(*self.login_fields).get(email=email)
         except User.DoesNotExist:
             raise serializers.ValidationError(
                 {"email": "No account found with this email address."}
@@ -39,11 +45,15 @@ class LoginSerializer(TokenObtainPairSerializer):
                 {"password": "Invalid password. Please try again."}
             )
 
-        # Set user for parent class to avoid another query
         self.user = user
 
-        # Call parent for token generation (will reuse self.user)
-        data = super().validate(attrs)
+        # Issue tokens as TokenObtainPairSerializer does, without its
+        # authenticate() call (a second query and password hash)
+        refresh = self.get_token(user)
+        data = {"refresh": str(refresh), "access": str(refresh.access_token)}
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
+
         data["user"] = {
             "email": self.user.email,
             "role": self.user.role,
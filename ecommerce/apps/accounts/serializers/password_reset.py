@@ -7,7 +7,7 @@ Serializers for password reset flow.
 from rest_framework import serializers
 from apps.accounts.models import User
 from apps.accounts.fields import PasswordField, PasswordConfirmField
-from apps.accounts.mixins import PasswordConfirmationMixin
+from apps.accounts.serializer_mixins import PasswordConfirmationMixin
 
 
 class PasswordResetRequestSerializer(serializers.Serializer):
@@ -45,7 +45,10 @@ class EmailChangeRequestSerializer(serializers.Serializer):
     password = serializers.CharField(write_only=True)
 
     def validate_new_email(self, value):
-        # Check if email is already in use
+        # Emails are stored lower-cased (see UserManager.create_user), so
+        # normalizing here lets an exact match use the unique email index
+        # and catch different-case duplicates.
+        value = value.lower()
         if User.objects.filter(email=value).exists():
             raise serializers.ValidationError("This email is already in use")
         return value
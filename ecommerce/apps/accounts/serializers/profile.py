@@ -4,12 +4,15 @@ User Profile Serializers
 Serializers that return user data with nested profile information.
 """
 
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
 from apps.accounts.models import User, AdminProfile, ShopKeeperProfile, CustomerProfile
+from apps.accounts.serializer_mixins import CachedFieldsMixin
 from apps.addresses.serializers import AddressListSerializer
 
 
-class AdminProfileNestedSerializer(serializers.ModelSerializer):
+class AdminProfileNestedSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Nested serializer for admin profile"""
 
     class Meta:
@@ -18,7 +21,7 @@ class AdminProfileNestedSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class ShopKeeperProfileNestedSerializer(serializers.ModelSerializer):
+class ShopKeeperProfileNestedSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Nested serializer for shopkeeper profile"""
 
     class Meta:
@@ -34,7 +37,7 @@ class ShopKeeperProfileNestedSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "is_verified", "created_at", "updated_at"]
 
 
-class CustomerProfileNestedSerializer(serializers.ModelSerializer):
+class CustomerProfileNestedSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Nested serializer for customer profile"""
 
     class Meta:
@@ -43,7 +46,17 @@ class CustomerProfileNestedSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+# Nested serializer and User reverse accessor for each role's profile.
+# The serializers are stateless, so one shared instance per role renders
+# every profile without a per-user __init__ and field binding.
+PROFILE_SERIALIZERS = {
+    User.Role.ADMIN: (AdminProfileNestedSerializer(), "adminprofile"),
+    User.Role.SHOPKEEPER: (ShopKeeperProfileNestedSerializer(), "shopkeeperprofile"),
+    User.Role.CUSTOMER: (CustomerProfileNestedSerializer(), "customerprofile"),
+}
+
+
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Base user profile serializer.
 
@@ -76,34 +89,78 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset, include_addresses=True):
+        """
+        Load role profiles and addresses with the users.
+
+        Keeps the query count constant however many users are serialized.
+        """
+        queryset = queryset.select_related(
+            "adminprofile", "shopkeeperprofile", "customerprofile"
+        ).only(*cls.get_load_columns())
+        if include_addresses:
+            queryset = queryset.prefetch_related("addresses")
+        return queryset
+
+    @classmethod
+    def get_load_columns(cls):
+        """
+        Columns the serializer renders, for use with QuerySet.only().
+
+        Covers the User fields in Meta.fields plus every role profile's
+        nested fields; anything else (password, last_login, ...) stays
+        deferred.
+        """
+        user_fields = {field.name for field in User._meta.concrete_fields}
+        columns = [name for name in cls.Meta.fields if name in user_fields]
+        for serializer, attr in PROFILE_SERIALIZERS.values():
+            columns += [f"{attr}__{name}" for name in serializer.Meta.fields]
+        return columns
+
     def get_profile(self, obj):
         """Get profile data based on user role"""
-        if obj.role == User.Role.ADMIN:
-            return AdminProfileNestedSerializer(obj.adminprofile).data
-        elif obj.role == User.Role.SHOPKEEPER:
-            return ShopKeeperProfileNestedSerializer(obj.shopkeeperprofile).data
-        elif obj.role == User.Role.CUSTOMER:
-            return CustomerProfileNestedSerializer(obj.customerprofile).data
-        return None
+        try:
+            serializer, attr = PROFILE_SERIALIZERS[obj.role]
+        except KeyError:
+            return None
+        return serializer.to_representation(getattr(obj, attr))
 
     def get_addresses(self, obj):
         """
         Get all addresses for the user.
 
         Returns:
-            List of address data dictionaries
+            List of address data dictionaries, or None when the caller
+            passed include_addresses=False in the serializer context
         """
-        addresses = obj.addresses.all().order_by("-is_default", "-created_at")
-        return AddressListSerializer(addresses, many=True).data
+        if not self.context.get("include_addresses", True):
+            return None
+        # Address.Meta.ordering already sorts default first, then newest, so
+        # this reuses prefetched rows instead of issuing a re-sorted query
+        return AddressListSerializer(obj.addresses.all(), many=True).data
 
     def update(self, instance, validated_data):
-        """Update user and profile data"""
-        # Update user fields
-        instance.phone = validated_data.get("phone", instance.phone)
-        instance.is_active = validated_data.get("is_active", instance.is_active)
-        instance.save()
+        """Update user data, writing only the submitted columns"""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
+    def update_profile(self, profile, changes):
+        """
+        Write changed profile fields with a single UPDATE.
 
-        return super().update(instance, validated_data)
+        The in-memory profile is updated too, so the response reflects
+        the change without reloading it.
+        """
+        if not changes:
+            return
+        changes["updated_at"] = timezone.now()
+        type(profile).objects.filter(pk=profile.pk).update(**changes)
+        for attr, value in changes.items():
+            setattr(profile, attr, value)
 
 
 class AdminProfileSerializer(UserProfileSerializer):
@@ -127,20 +184,16 @@ class ShopKeeperProfileSerializer(UserProfileSerializer):
 
     def update(self, instance, validated_data):
         """Update shopkeeper user and profile"""
-        # Extract profile fields
-        shop_name = validated_data.pop("shop_name", None)
-        gst_number = validated_data.pop("gst_number", None)
+        # Extract profile fields, skipping blank values
+        changes = {
+            field: value
+            for field in ("shop_name", "gst_number")
+            if (value := validated_data.pop(field, None))
+        }
 
-        # Update user
-        instance = super().update(instance, validated_data)
-
-        # Update profile
-        profile = instance.shopkeeperprofile
-        if shop_name:
-            profile.shop_name = shop_name
-        if gst_number:
-            profile.gst_number = gst_number
-        profile.save()
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            self.update_profile(instance.shopkeeperprofile, changes)
 
         return instance
 
@@ -155,16 +208,12 @@ class CustomerProfileSerializer(UserProfileSerializer):
 
     def update(self, instance, validated_data):
         """Update customer user and profile"""
-        # Extract profile fields
+        # Extract profile fields, skipping blank values
         full_name = validated_data.pop("full_name", None)
+        changes = {"full_name": full_name} if full_name else {}
 
-        # Update user
-        instance = super().update(instance, validated_data)
-
-        # Update profile
-        profile = instance.customerprofile
-        if full_name:
-            profile.full_name = full_name
-        profile.save()
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            self.update_profile(instance.customerprofile, changes)
 
         return instance
@@ -19,13 +19,14 @@ from apps.accounts.fields import (
     PhoneField,
 )
 from apps.accounts.serializer_mixins import (
+    CachedFieldsMixin,
     PasswordConfirmationMixin,
     ProfileCreationMixin,
 )
 
 
 class BaseRegistrationSerializer(
-    PasswordConfirmationMixin, serializers.ModelSerializer
+    CachedFieldsMixin, PasswordConfirmationMixin, serializers.ModelSerializer
 ):
     """
     Base serializer for user registration.
@@ -213,14 +214,13 @@ class LegacyRegisterSerializer(serializers.ModelSerializer):
         gst_number = validated_data.pop("gst_number", None)
         full_name = validated_data.pop("full_name", None)
 
-        user = User.objects.create_user(**validated_data)
+        # Profile is created by signal - hand it the fields so it is
+        # inserted complete instead of updated afterwards
+        if validated_data["role"] == User.Role.SHOPKEEPER:
+            profile_data = {"shop_name": shop_name, "gst_number": gst_number}
+        elif validated_data["role"] == User.Role.CUSTOMER:
+            profile_data = {"full_name": full_name}
+        else:
+            profile_data = None
 
-        # Profile is created by signal - update directly without extra SELECT
-        if user.role == User.Role.SHOPKEEPER:
-            ShopKeeperProfile.objects.filter(user=user).update(
-                shop_name=shop_name, gst_number=gst_number
-            )
-        elif user.role == User.Role.CUSTOMER:
-            CustomerProfile.objects.filter(user=user).update(full_name=full_name)
-
-        return user
+        return User.objects.create_user(profile_data=profile_data, **validated_data)
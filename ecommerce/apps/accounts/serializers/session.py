@@ -1,10 +1,13 @@
 from rest_framework import serializers
 from apps.accounts.models import UserSession
+from apps.accounts.serializer_mixins import CachedFieldsMixin
 
 
-class UserSessionSerializer(serializers.ModelSerializer):
+class UserSessionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for user session details"""
 
+    user_agent = serializers.CharField(source="user_agent.text", read_only=True)
+
     class Meta:
         model = UserSession
         fields = [
@@ -5,13 +5,15 @@ Handles all security-related event logging for the accounts app.
 """
 
 import logging
-from typing import Tuple, Optional
+from typing import Any, Iterable, List, Tuple, Optional
+from django.db import transaction
 from django.http import HttpRequest
 from apps.accounts.models import AuditLog, User
 from apps.accounts import constants
 from apps.accounts.utils import get_client_ip, get_user_agent
 
-# Get security logger for file-based logging
+# Get security logger for file-based logging; messages use %-style args so
+# formatting (including metadata dicts) is skipped when INFO is filtered out
 security_logger = logging.getLogger("security")
 
 
@@ -30,10 +32,100 @@ class AuditService:
         # Also log to file-based logger
         user_email = user.email if user else "anonymous"
         security_logger.info(
-            f"AUDIT: {action} | User: {user_email} | IP: {ip_address} | Metadata: {metadata}"
+            "AUDIT: %s | User: %s | IP: %s | Metadata: %s",
+            action,
+            user_email,
+            ip_address,
+            metadata,
         )
 
-        return AuditLog.objects.create(
+        # bulk_create skips Model.save() and the pre/post_save signal
+        # dispatch, which audit rows never need
+        (log,) = AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    user=user,
+                    action=action,
+                    ip_address=ip_address,
+                    user_agent=user_agent or "",
+                    metadata=metadata or {},
+                )
+            ]
+        )
+        return log
+
+    @staticmethod
+    def _log_request_event(
+        action: str,
+        request: HttpRequest,
+        user: Optional[User] = None,
+        metadata: Optional[dict] = None,
+    ) -> AuditLog:
+        """Create an audit log entry with the request's IP and user agent"""
+        ip_address, user_agent = AuditService._get_request_metadata(request)
+        return AuditService._log_event(
+            action=action,
+            user=user,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    def _queue_event(
+        action: str,
+        user: User,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ) -> None:
+        """
+        Hand an audit log entry to Celery once the transaction commits.
+
+        For service-layer events that have no request to buffer on; the
+        INSERT happens in the worker, off the request thread.
+        """
+        # Imported here: the tasks module imports the services package
+        from apps.accounts.tasks import record_audit_log_task
+
+        security_logger.info(
+            "AUDIT: %s | User: %s | IP: %s | Metadata: %s",
+            action,
+            user.email,
+            ip_address,
+            metadata,
+        )
+        transaction.on_commit(
+            lambda user_id=user.pk: record_audit_log_task.delay(
+                user_id, action, ip_address, user_agent, metadata
+            )
+        )
+
+    @staticmethod
+    def _defer_event(
+        request: HttpRequest,
+        action: str,
+        user: Optional[User] = None,
+        metadata: Optional[dict] = None,
+    ) -> AuditLog:
+        """
+        Buffer an audit log entry on the request and write it on commit.
+
+        Under AuditLogBufferMiddleware, entries whose transaction commits
+        collect on the request and are inserted with a single bulk_create
+        once the view returns. Without it, each entry is written at commit.
+        """
+        ip_address, user_agent = AuditService._get_request_metadata(request)
+        user_email = user.email if user else "anonymous"
+        security_logger.info(
+            "AUDIT: %s | User: %s | IP: %s | Metadata: %s",
+            action,
+            user_email,
+            ip_address,
+            metadata,
+        )
+
+        log = AuditLog(
             user=user,
             action=action,
             ip_address=ip_address,
@@ -41,18 +133,96 @@ class AuditService:
             metadata=metadata or {},
         )
 
+        # One callback per entry, so Django drops exactly the entries whose
+        # transaction or savepoint rolls back
+        pending = getattr(request, "_pending_audit_logs", None)
+        if pending is None:
+            transaction.on_commit(lambda: AuditLog.objects.bulk_create([log]))
+        else:
+            transaction.on_commit(lambda: pending.append(log))
+        return log
+
+    @staticmethod
+    def flush_deferred(request: HttpRequest) -> List[AuditLog]:
+        """
+        Insert the committed entries buffered on a request in one query.
+
+        Called by AuditLogBufferMiddleware after the view has returned.
+
+        Returns:
+            Created AuditLog instances
+        """
+        pending = getattr(request, "_pending_audit_logs", None)
+        if not pending:
+            return []
+        logs = pending[:]
+        pending.clear()
+        return AuditLog.objects.bulk_create(
+            logs, batch_size=constants.AUDIT_LOG_BULK_BATCH_SIZE
+        )
+
+    @staticmethod
+    def log_admin_action(
+        action: str,
+        request: HttpRequest,
+        events: Iterable[Tuple[Any, Optional[dict]]],
+    ) -> List[AuditLog]:
+        """
+        Log a bulk admin action with a single INSERT.
+
+        Args:
+            action: Action recorded for every affected user
+            request: Admin HTTP request (the acting staff user)
+            events: Iterable of (user_id, metadata) tuples, one per affected row
+
+        Returns:
+            Created AuditLog instances
+        """
+        ip_address, user_agent = AuditService._get_request_metadata(request)
+        performed_by = request.user.email
+
+        logs = [
+            AuditLog(
+                user_id=user_id,
+                action=action,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                metadata={"performed_by": performed_by, **(metadata or {})},
+            )
+            for user_id, metadata in events
+        ]
+
+        security_logger.info(
+            "AUDIT: %s | Admin: %s | IP: %s | Count: %s",
+            action,
+            performed_by,
+            ip_address,
+            len(logs),
+        )
+
+        return AuditLog.objects.bulk_create(
+            logs, batch_size=constants.AUDIT_LOG_BULK_BATCH_SIZE
+        )
+
     @staticmethod
     def _get_request_metadata(request: HttpRequest) -> Tuple[Optional[str], str]:
         """
         Extract IP address and user agent from request.
 
+        Memoized on the request, so several audit events logged during one
+        request parse the forwarding headers only once.
+
         Args:
             request: HTTP request object
 
         Returns:
             Tuple of (ip_address, user_agent)
         """
-        return get_client_ip(request), get_user_agent(request)
+        try:
+            return request._audit_meta
+        except AttributeError:
+            request._audit_meta = get_client_ip(request), get_user_agent(request)
+            return request._audit_meta
 
     @staticmethod
     def log_login(user: User, request: HttpRequest) -> AuditLog:
@@ -66,23 +236,15 @@ class AuditService:
         Returns:
             Created AuditLog instance
         """
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action=constants.AUDIT_ACTION_LOGIN,
-            user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
+        return AuditService._log_request_event(
+            constants.AUDIT_ACTION_LOGIN, request, user=user
         )
 
     @staticmethod
     def log_logout(user: User, request: HttpRequest) -> AuditLog:
         """Log logout"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action=constants.AUDIT_ACTION_LOGOUT,
-            user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
+        return AuditService._log_request_event(
+            constants.AUDIT_ACTION_LOGOUT, request, user=user
         )
 
     @staticmethod
@@ -94,13 +256,8 @@ class AuditService:
         if reason:
             metadata["reason"] = reason
 
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action=constants.AUDIT_ACTION_FAILED_LOGIN,
-            user=None,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            metadata=metadata,
+        return AuditService._log_request_event(
+            constants.AUDIT_ACTION_FAILED_LOGIN, request, user=None, metadata=metadata
         )
 
     @staticmethod
@@ -108,21 +265,19 @@ class AuditService:
         user: User, request: HttpRequest, metadata: Optional[dict] = None
     ) -> AuditLog:
         """Log password change"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action=constants.AUDIT_ACTION_PASSWORD_CHANGE,
+        return AuditService._log_request_event(
+            constants.AUDIT_ACTION_PASSWORD_CHANGE,
+            request,
             user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
             metadata=metadata,
         )
 
     @staticmethod
     def log_password_reset_request(
         user: User, ip_address: str = None, user_agent: str = None
-    ) -> AuditLog:
+    ) -> None:
         """Log password reset request"""
-        return AuditService._log_event(
+        AuditService._queue_event(
             action="PASSWORD_RESET_REQUEST",
             user=user,
             ip_address=ip_address,
@@ -132,9 +287,9 @@ class AuditService:
     @staticmethod
     def log_password_reset_complete(
         user: User, ip_address: str = None, user_agent: str = None
-    ) -> AuditLog:
+    ) -> None:
         """Log password reset completion"""
-        return AuditService._log_event(
+        AuditService._queue_event(
             action="PASSWORD_RESET_COMPLETE",
             user=user,
             ip_address=ip_address,
@@ -146,21 +301,19 @@ class AuditService:
         user: User, request: HttpRequest, metadata: Optional[dict] = None
     ) -> AuditLog:
         """Log email verification"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action=constants.AUDIT_ACTION_EMAIL_VERIFICATION,
+        return AuditService._log_request_event(
+            constants.AUDIT_ACTION_EMAIL_VERIFICATION,
+            request,
             user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
             metadata=metadata,
         )
 
     @staticmethod
     def log_email_change_request(
         user: User, new_email: str, ip_address: str = None, user_agent: str = None
-    ) -> AuditLog:
+    ) -> None:
         """Log email change request"""
-        return AuditService._log_event(
+        AuditService._queue_event(
             action="EMAIL_CHANGE_REQUEST",
             user=user,
             ip_address=ip_address,
@@ -175,9 +328,9 @@ class AuditService:
         new_email: str,
         ip_address: str = None,
         user_agent: str = None,
-    ) -> AuditLog:
+    ) -> None:
         """Log email change completion - stores the history forever"""
-        return AuditService._log_event(
+        AuditService._queue_event(
             action="EMAIL_CHANGE_COMPLETE",
             user=user,
             ip_address=ip_address,
@@ -189,13 +342,11 @@ class AuditService:
     def log_account_created(
         user: User, request: HttpRequest, metadata: Optional[dict] = None
     ) -> AuditLog:
-        """Log account creation"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
+        """Log account creation (written when the registration commits)"""
+        return AuditService._defer_event(
+            request,
             action=constants.AUDIT_ACTION_ACCOUNT_CREATED,
             user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
             metadata=metadata,
         )
 
@@ -211,13 +362,8 @@ class AuditService:
         if session_id:
             meta["session_id"] = str(session_id)
 
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action=constants.AUDIT_ACTION_SESSION_REVOKED,
-            user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            metadata=meta,
+        return AuditService._log_request_event(
+            constants.AUDIT_ACTION_SESSION_REVOKED, request, user=user, metadata=meta
         )
 
     @staticmethod
@@ -225,12 +371,10 @@ class AuditService:
         user: User, request: HttpRequest, changes: Optional[dict] = None
     ) -> AuditLog:
         """Log profile update with what changed"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action="PROFILE_UPDATE",
+        return AuditService._log_request_event(
+            "PROFILE_UPDATE",
+            request,
             user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
             metadata={"changes": changes} if changes else {},
         )
 
@@ -239,12 +383,10 @@ class AuditService:
         user: User, request: HttpRequest, reason: str = None
     ) -> AuditLog:
         """Log account deactivation"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action="ACCOUNT_DEACTIVATED",
+        return AuditService._log_request_event(
+            "ACCOUNT_DEACTIVATED",
+            request,
             user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
             metadata={"reason": reason} if reason else {},
         )
 
@@ -253,11 +395,9 @@ class AuditService:
         user: User, request: HttpRequest, reason: str = None
     ) -> AuditLog:
         """Log account reactivation"""
-        ip_address, user_agent = AuditService._get_request_metadata(request)
-        return AuditService._log_event(
-            action="ACCOUNT_REACTIVATED",
+        return AuditService._log_request_event(
+            "ACCOUNT_REACTIVATED",
+            request,
             user=user,
-            ip_address=ip_address,
-            user_agent=user_agent,
             metadata={"reason": reason} if reason else {},
         )
@@ -1,5 +1,9 @@
+from django.db import transaction
+from django.db.models import Subquery
 from rest_framework_simplejwt.tokens import RefreshToken
-from apps.accounts.models import UserSession
+from apps.accounts import constants
+from apps.accounts.models import UserAgent, UserSession
+from apps.accounts.services.session_cache import SessionCacheService
 from apps.accounts.utils import get_client_ip, get_user_agent
 
 
@@ -16,31 +20,52 @@ class AuthService:
         }
 
     @staticmethod
-    def create_session(user, request):
+    @transaction.atomic(savepoint=False)
+    def create_session(user, request, tokens=None):
         """
         Create a session for a user (with auto-cleanup of oldest session if limit reached).
+        Pass tokens when a pair was already issued for this login (e.g. by
+        LoginSerializer) so the JWTs are not signed twice.
         Returns (session, tokens) tuple.
         """
-        from apps.accounts import constants
-
-        # Check if max sessions reached
-        active_sessions = UserSession.objects.filter(
-            user=user, is_active=True
-        ).order_by("created_at")
-
-        if active_sessions.count() >= constants.MAX_ACTIVE_SESSIONS_PER_USER:
-            # Invalidate the oldest session
-            oldest = active_sessions.first()
-            if oldest:
-                oldest.invalidate()
-
-        # Generate a unique session key (using JWT token as session key)
-        tokens = AuthService.get_tokens_for_user(user)
-        session_key = tokens["refresh"]  # Use refresh token as session identifier
+        # Check if max sessions reached. A cached count at the limit may be
+        # stale (e.g. sessions revoked through another worker), so confirm
+        # it in the database before evicting a live session
+        limit = constants.MAX_ACTIVE_SESSIONS_PER_USER
+        cached_count = SessionCacheService.get_count(user.pk)
+        if cached_count is not None and cached_count < limit:
+            active_count = cached_count
+        else:
+            active_count = AuthService.capped_active_session_count(
+                user, use_cache=False
+            )
+            if cached_count is not None and active_count < limit:
+                SessionCacheService.forget(user.pk)
+
+        evict = active_count >= limit
+        if evict:
+            # Invalidate the oldest session in one UPDATE ... WHERE id = (SELECT ...).
+            # Concurrent logins skip a row another one is already evicting
+            # instead of queueing behind its lock
+            oldest = (
+                UserSession.objects.select_for_update(skip_locked=True)
+                .filter(user=user, is_active=True)
+                .order_by("created_at")
+                .values("pk")[:1]
+            )
+            UserSession.objects.filter(pk=Subquery(oldest), is_active=True).update(
+                is_active=False
+            )
+
+        # Generate tokens; the session is keyed by a short hash of the
+        # refresh token rather than the JWT itself
+        if tokens is None:
+            tokens = AuthService.get_tokens_for_user(user)
+        session_key = UserSession.key_for_token(tokens["refresh"])
 
         # Extract IP and user agent using centralized utilities
         ip_address = get_client_ip(request)
-        user_agent = get_user_agent(request)
+        user_agent = UserAgent.objects.intern(get_user_agent(request))
 
         # Create session
         session = UserSession.objects.create(
@@ -49,6 +74,10 @@ class AuthService:
             ip_address=ip_address,
             user_agent=user_agent,
         )
+        if evict:
+            SessionCacheService.seed(user.pk, active_count)
+        else:
+            SessionCacheService.increment(user.pk, active_count + 1)
 
         return session, tokens
 
@@ -58,6 +87,7 @@ class AuthService:
         try:
             session = UserSession.objects.get(id=session_id, is_active=True)
             session.invalidate()
+            SessionCacheService.forget(session.user_id)
             return True, "Session invalidated successfully"
         except UserSession.DoesNotExist:
             return False, "Session not found or already inactive"
@@ -65,7 +95,9 @@ class AuthService:
     @staticmethod
     def get_active_sessions(user):
         """Get all active sessions for a user"""
-        return UserSession.objects.filter(user=user, is_active=True)
+        return UserSession.objects.filter(user=user, is_active=True).select_related(
+            "user_agent"
+        )
 
     @staticmethod
     def invalidate_all_sessions(user, except_session_id=None):
@@ -75,6 +107,7 @@ class AuthService:
             sessions = sessions.exclude(id=except_session_id)
 
         count = sessions.update(is_active=False)
+        SessionCacheService.forget(user.pk)
         return count
 
     @staticmethod
@@ -82,12 +115,27 @@ class AuthService:
         """Count active sessions for a user"""
         return UserSession.objects.filter(user=user, is_active=True).count()
 
+    @staticmethod
+    def capped_active_session_count(user, use_cache: bool = True) -> int:
+        """
+        Count active sessions, up to MAX_ACTIVE_SESSIONS_PER_USER.
+
+        Served from SessionCacheService when possible (unless use_cache is
+        False); otherwise counts at most the limit's worth of rows, so the
+        database stops reading the index once the limit is known to be
+        reached.
+        """
+        count = SessionCacheService.get_count(user.pk) if use_cache else None
+        if count is None:
+            limit = constants.MAX_ACTIVE_SESSIONS_PER_USER
+            active = UserSession.objects.filter(user=user, is_active=True).order_by()
+            count = active.values("pk")[:limit].count()
+        return min(count, constants.MAX_ACTIVE_SESSIONS_PER_USER)
+
     @staticmethod
     def has_max_active_sessions(user) -> bool:
         """Check if user has reached maximum active sessions limit"""
-        from apps.accounts import constants
-
         return (
-            AuthService.count_active_sessions(user)
+            AuthService.capped_active_session_count(user)
             >= constants.MAX_ACTIVE_SESSIONS_PER_USER
         )
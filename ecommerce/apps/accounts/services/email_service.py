@@ -3,26 +3,40 @@ from django.conf import settings
 from django.db import transaction
 from apps.accounts.models import EmailVerificationToken, User
 from apps.accounts import constants
+from apps.accounts.utils import PrecompiledTemplate
+from apps.accounts.services.token_cache import TokenCacheService
+
+# Email bodies are parsed once at import instead of on every send
+VERIFICATION_EMAIL = PrecompiledTemplate(constants.EMAIL_VERIFICATION_TEMPLATE)
+PASSWORD_RESET_EMAIL = PrecompiledTemplate(constants.EMAIL_PASSWORD_RESET_TEMPLATE)
+EMAIL_CHANGE_EMAIL = PrecompiledTemplate(constants.EMAIL_CHANGE_TEMPLATE)
 
 
 class EmailService:
     """Service for handling email verification"""
 
     @staticmethod
-    def send_verification_email(user):
+    def send_verification_email(user, connection=None):
         """
-        Create a verification token and send verification email to user.
-        Returns the created token.
+        Send a verification email to user, creating a token if needed.
+        Pass an open mail connection to reuse it across several sends.
+        Returns the token that was sent.
         """
-        # Create verification token
-        token = EmailVerificationToken.objects.create(user=user)
+        # Reuse the user's pending token, so a retried send (flaky SMTP)
+        # mails the same link instead of leaving a valid token per attempt
+        token = (
+            EmailVerificationToken.objects.valid()
+            .filter(user=user)
+            .order_by("-created_at")
+            .first()
+        ) or EmailVerificationToken.objects.create(user=user)
 
         # Build verification URL (customize based on your frontend)
         verification_url = f"{settings.FRONTEND_URL}/verify-email/{token.token}"
 
         # Build email from template
         subject = constants.EMAIL_SUBJECT_VERIFICATION
-        message = constants.EMAIL_VERIFICATION_TEMPLATE.format(
+        message = VERIFICATION_EMAIL.render(
             email=user.email,
             verification_url=verification_url,
             expiry_hours=constants.EMAIL_VERIFICATION_EXPIRY_HOURS,
@@ -34,6 +48,7 @@ class EmailService:
             settings.DEFAULT_FROM_EMAIL,
             [user.email],
             fail_silently=False,
+            connection=connection,
         )
 
         return token
@@ -45,25 +60,40 @@ class EmailService:
         Verify email using token.
         Returns (success: bool, message: str, user: User|None)
         """
+        kind = constants.TOKEN_KIND_EMAIL_VERIFICATION
+        rejection = TokenCacheService.get_rejection(kind, token_value)
+        if rejection:
+            return False, rejection, None
+
         try:
-            # Lock the token row
-            token = EmailVerificationToken.objects.select_for_update().get(
-                token=token_value
+            # Load the token with its user, locking only the token row; that
+            # lock already serializes concurrent redemptions
+            token = (
+                EmailVerificationToken.objects.select_related("user")
+                .defer("user__password")
+                .select_for_update(of=("self",))
+                .get(token=token_value)
             )
 
             if not token.is_valid():
                 if token.is_used:
-                    return False, "This verification link has already been used", None
+                    rejection = constants.EMAIL_LINK_USED
                 else:
-                    return False, "This verification link has expired", None
-
-            # Mark token as used
-            token.mark_as_used()
+                    rejection = constants.EMAIL_LINK_EXPIRED
+                TokenCacheService.remember_rejection(kind, token_value, rejection)
+                return False, rejection, None
+
+            # Mark token as used; only the caller that flips is_used wins
+            if not token.mark_as_used():
+                return False, constants.EMAIL_LINK_USED, None
+            TokenCacheService.remember_consumed(
+                kind, token_value, constants.EMAIL_LINK_USED
+            )
 
-            # Mark user email as verified with database-level locking
-            user = User.objects.select_for_update().get(pk=token.user_id)
+            # Mark user email as verified with a plain UPDATE (no save signals)
+            user = token.user
+            User.objects.filter(pk=user.pk).update(email_verified=True)
             user.email_verified = True
-            user.save(update_fields=["email_verified"])
 
             return True, "Email verified successfully", user
 
@@ -79,11 +109,17 @@ class EmailService:
         if user.email_verified:
             return False, "Email is already verified"
 
+        # Imported here: the tasks module imports this service
+        from apps.accounts.tasks import send_verification_email_task
+
         # Delete old unused tokens
         EmailVerificationToken.objects.filter(user=user, is_used=False).delete()
 
-        # Send new verification email
-        EmailService.send_verification_email(user)
+        # Queue new verification email; the worker creates the token and
+        # does the SMTP round trip once this transaction has committed
+        transaction.on_commit(
+            lambda user_id=user.pk: send_verification_email_task.delay(user_id)
+        )
 
         return True, "Verification email sent"
 
@@ -91,7 +127,7 @@ class EmailService:
     def send_password_reset_email(user, reset_url, expiry_hours):
         """Send password reset email"""
         subject = constants.EMAIL_PASSWORD_RESET_SUBJECT
-        message = constants.EMAIL_PASSWORD_RESET_TEMPLATE.format(
+        message = PASSWORD_RESET_EMAIL.render(
             email=user.email,
             reset_url=reset_url,
             expiry_hours=expiry_hours,
@@ -109,7 +145,7 @@ class EmailService:
     def send_email_change_email(new_email, verification_url, expiry_hours):
         """Send email change verification email to the NEW address"""
         subject = constants.EMAIL_CHANGE_SUBJECT
-        message = constants.EMAIL_CHANGE_TEMPLATE.format(
+        message = EMAIL_CHANGE_EMAIL.render(
             new_email=new_email,
             verification_url=verification_url,
             expiry_hours=expiry_hours,
@@ -7,14 +7,31 @@ Business logic for password reset and email change flows.
 import logging
 from typing import Tuple
 from django.conf import settings
-from django.db import transaction
+from django.contrib.auth import password_validation
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from apps.accounts import constants
 from apps.accounts.models import User, PasswordResetToken, EmailChangeToken
 from apps.accounts.services.audit_service import AuditService
-from apps.accounts.services.email_service import EmailService
+from apps.accounts.services.token_cache import TokenCacheService
+from apps.accounts.tasks import (
+    send_email_change_email_task,
+    send_password_reset_email_task,
+)
 
 # Get security logger
 security_logger = logging.getLogger("security")
 
+RESET_LINK_DEAD = "This reset link has expired or already been used"
+EMAIL_CHANGE_LINK_DEAD = "This verification link has expired or already been used"
+
+
+def _is_dead(token) -> bool:
+    """A token that is used or expired can never become valid again."""
+    return token.is_used or token.expires_at <= timezone.now()
+
 
 class PasswordResetService:
     """Service for password reset operations."""
@@ -37,8 +54,18 @@ class PasswordResetService:
         Returns:
             Tuple of (success, message)
         """
+        # One reset per address per cooldown: repeats (and enumeration
+        # scans) are answered from the cache without touching the database
+        cooldown_key = (
+            f"{constants.PASSWORD_RESET_COOLDOWN_CACHE_PREFIX}:{email.lower()}"
+        )
+        if not cache.add(
+            cooldown_key, True, timeout=constants.PASSWORD_RESET_COOLDOWN_SECONDS
+        ):
+            return True, "If an account exists, a reset link has been sent"
+
         try:
-            user = User.objects.get(email=email, is_active=True)
+            user = User.objects.light().get(email=email, is_active=True)
         except User.DoesNotExist:
             # Log attempt for non-existent user (security monitoring)
             security_logger.warning(
@@ -65,21 +92,47 @@ class PasswordResetService:
         # Build reset URL
         reset_url = f"{settings.FRONTEND_URL}/reset-password/{token.token}"
 
-        # Send email using centralized service
-        EmailService.send_password_reset_email(
-            user=user,
-            reset_url=reset_url,
-            expiry_hours=PasswordResetToken.EXPIRY_HOURS,
+        # Queue the email once the token row is committed
+        transaction.on_commit(
+            lambda: send_password_reset_email_task.delay(
+                user.pk, reset_url, PasswordResetToken.EXPIRY_HOURS
+            )
         )
 
         return True, "If an account exists, a reset link has been sent"
 
     @staticmethod
-    @transaction.atomic
+    def _reject_reset_token(token_uuid: str) -> Tuple[bool, str]:
+        """Log and reject a reset token that is unknown, expired or used."""
+        stale = (
+            PasswordResetToken.objects.select_related("user")
+            .filter(token=token_uuid)
+            .first()
+        )
+        if stale is None:
+            security_logger.warning(
+                f"Invalid password reset token attempted: {token_uuid}"
+            )
+            return False, "Invalid or expired reset link"
+        security_logger.warning(
+            f"Expired/used password reset token attempted: {token_uuid} | User: {stale.user.email}"
+        )
+        if _is_dead(stale):
+            TokenCacheService.remember_rejection(
+                constants.TOKEN_KIND_PASSWORD_RESET, token_uuid, RESET_LINK_DEAD
+            )
+        return False, RESET_LINK_DEAD
+
+    @staticmethod
     def confirm_password_reset(token_uuid: str, new_password: str) -> Tuple[bool, str]:
         """
         Confirm password reset with new password.
 
+        The password is hashed before the transaction starts, so the slow
+        key derivation does not run while the token row is locked. A cheap
+        unlocked check runs first, so a request with a bogus token never
+        costs a password hash.
+
         Args:
             token_uuid: The reset token UUID
             new_password: The new password
@@ -87,34 +140,50 @@ class PasswordResetService:
         Returns:
             Tuple of (success, message)
         """
-        try:
-            token = PasswordResetToken.objects.select_for_update().get(token=token_uuid)
-        except PasswordResetToken.DoesNotExist:
-            security_logger.warning(
-                f"Invalid password reset token attempted: {token_uuid}"
+        kind = constants.TOKEN_KIND_PASSWORD_RESET
+        rejection = TokenCacheService.get_rejection(kind, token_uuid)
+        if rejection:
+            return False, rejection
+
+        if not PasswordResetToken.objects.valid().filter(token=token_uuid).exists():
+            return PasswordResetService._reject_reset_token(token_uuid)
+
+        hashed_password = make_password(new_password)
+
+        with transaction.atomic():
+            # Validate and load the token with its user, locking only the
+            # token row; that lock already serializes concurrent redemptions
+            token = (
+                PasswordResetToken.objects.valid()
+                .select_related("user")
+                .defer("user__password")
+                .select_for_update(of=("self",))
+                .filter(token=token_uuid)
+                .first()
             )
-            return False, "Invalid or expired reset link"
 
-        if not token.is_valid():
-            security_logger.warning(
-                f"Expired/used password reset token attempted: {token_uuid} | User: {token.user.email}"
-            )
-            return False, "This reset link has expired or already been used"
+            if token is None:
+                # Consumed or expired since the check above
+                return PasswordResetService._reject_reset_token(token_uuid)
 
-        # Update password with database-level locking on User
-        user = User.objects.select_for_update().get(pk=token.user_id)
-        user.set_password(new_password)
-        user.save(update_fields=["password"])
+            # Mark token as used; only the caller that flips is_used wins
+            if not token.mark_as_used():
+                return False, RESET_LINK_DEAD
+            TokenCacheService.remember_consumed(kind, token_uuid, RESET_LINK_DEAD)
 
-        # Mark token as used
-        token.mark_as_used()
+            user = token.user
+            user.password = hashed_password
+            user.save(update_fields=["password"])
 
-        # Log the successful password reset (context will be captured by AuditService)
-        # We don't need to pass IP/UA here if we want current context,
-        # but for accuracy we'll let AuditService handle it via request or defaults.
-        AuditService.log_password_reset_complete(
-            user=user,
-        )
+            # Log the successful password reset (context will be captured by AuditService)
+            # We don't need to pass IP/UA here if we want current context,
+            # but for accuracy we'll let AuditService handle it via request or defaults.
+            AuditService.log_password_reset_complete(
+                user=user,
+            )
+
+        # What save() would have done after set_password()
+        password_validation.password_changed(new_password, user)
 
         security_logger.info(f"Password reset completed for user: {user.email}")
         return True, "Password has been reset successfully"
@@ -165,11 +234,11 @@ class EmailChangeService:
         # Build verification URL
         verification_url = f"{settings.FRONTEND_URL}/verify-email-change/{token.token}"
 
-        # Send email to NEW address using centralized service
-        EmailService.send_email_change_email(
-            new_email=new_email,
-            verification_url=verification_url,
-            expiry_hours=EmailChangeToken.EXPIRY_HOURS,
+        # Queue email to NEW address once the token row is committed
+        transaction.on_commit(
+            lambda: send_email_change_email_task.delay(
+                new_email, verification_url, EmailChangeToken.EXPIRY_HOURS
+            )
         )
 
         return True, f"Verification email sent to {new_email}"
@@ -186,32 +255,65 @@ class EmailChangeService:
         Returns:
             Tuple of (success, message)
         """
-        try:
-            token = EmailChangeToken.objects.select_for_update().get(token=token_uuid)
-        except EmailChangeToken.DoesNotExist:
-            security_logger.warning(
-                f"Invalid email change token attempted: {token_uuid}"
-            )
-            return False, "Invalid or expired verification link"
+        kind = constants.TOKEN_KIND_EMAIL_CHANGE
+        rejection = TokenCacheService.get_rejection(kind, token_uuid)
+        if rejection:
+            return False, rejection
+
+        # Validate (including the email-unchanged check) and load the token
+        # with its user, locking only the token row
+        token = (
+            EmailChangeToken.objects.valid()
+            .select_related("user")
+            .defer("user__password")
+            .select_for_update(of=("self",))
+            .filter(token=token_uuid)
+            .first()
+        )
 
-        if not token.is_valid():
+        if token is None:
+            stale = (
+                EmailChangeToken.objects.select_related("user")
+                .filter(token=token_uuid)
+                .first()
+            )
+            if stale is None:
+                security_logger.warning(
+                    f"Invalid email change token attempted: {token_uuid}"
+                )
+                return False, "Invalid or expired verification link"
             security_logger.warning(
-                f"Expired/used email change token attempted: {token_uuid} | User: {token.user.email}"
+                f"Expired/used email change token attempted: {token_uuid} | User: {stale.user.email}"
             )
-            return False, "This verification link has expired or already been used"
+            if _is_dead(stale):
+                TokenCacheService.remember_rejection(
+                    kind, token_uuid, EMAIL_CHANGE_LINK_DEAD
+                )
+            return False, EMAIL_CHANGE_LINK_DEAD
 
-        # Check if new email is still available
-        if User.objects.filter(email=token.new_email).exists():
-            return False, "This email is already in use by another account"
-
-        # Update user's email with database-level locking
-        user = User.objects.select_for_update().get(pk=token.user_id)
+        user = token.user
         old_email = user.email
+        try:
+            # Consume the token and change the email in one savepoint, so a
+            # taken address leaves the token unused. The unique index on
+            # email doubles as the availability check, saving a SELECT.
+            with transaction.atomic():
+                # Only the caller that flips is_used wins
+                if not token.mark_as_used():
+                    return False, EMAIL_CHANGE_LINK_DEAD
+                # The user row is not locked, so re-check the current email
+                # in the UPDATE itself; a concurrent change makes it match
+                # nothing and the savepoint is rolled back
+                changed = User.objects.filter(
+                    pk=user.pk, email=token.current_email
+                ).update(email=token.new_email)
+                if not changed:
+                    transaction.set_rollback(True)
+                    return False, EMAIL_CHANGE_LINK_DEAD
+        except IntegrityError:
+            return False, "This email is already in use by another account"
         user.email = token.new_email
-        user.save(update_fields=["email"])
-
-        # Mark token as used
-        token.mark_as_used()
+        TokenCacheService.remember_consumed(kind, token_uuid, EMAIL_CHANGE_LINK_DEAD)
 
         # Log the successful email change (THIS IS THE PERMANENT HISTORY!)
         AuditService.log_email_change_complete(
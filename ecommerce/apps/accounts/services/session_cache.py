@@ -0,0 +1,78 @@
+"""
+Session Cache Service
+
+Caches how many active sessions each user has, so the per-login session
+limit check does not have to count rows in the database. The count is
+incremented on login and dropped whenever sessions are revoked; the timeout
+bounds any drift. A cached count at the limit is only a hint: it is
+confirmed against the database before a live session is evicted.
+"""
+
+from contextlib import suppress
+from typing import Optional
+from django.core.cache import cache
+from django.db import transaction
+from apps.accounts import constants
+
+
+class SessionCacheService:
+    """Cache of active session counts per user"""
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"{constants.ACTIVE_SESSION_CACHE_PREFIX}:{user_id}"
+
+    @staticmethod
+    def get_count(user_id) -> Optional[int]:
+        """
+        Get the cached active session count for a user.
+
+        Returns:
+            Count capped at the session limit, or None if not cached
+        """
+        return cache.get(SessionCacheService._key(user_id))
+
+    @staticmethod
+    def seed(user_id, count: int) -> None:
+        """
+        Cache a freshly counted total once the current transaction commits.
+
+        Never overwrites an existing value, which a concurrent login may
+        have incremented since the count was read.
+        """
+        transaction.on_commit(
+            lambda: cache.add(
+                SessionCacheService._key(user_id),
+                count,
+                timeout=constants.ACTIVE_SESSION_CACHE_TIMEOUT,
+            )
+        )
+
+    @staticmethod
+    def increment(user_id, count: int) -> None:
+        """
+        Count one new session once the current transaction commits.
+
+        The cached value is incremented atomically; count (the total
+        including the new session) only seeds a missing key.
+        """
+        key = SessionCacheService._key(user_id)
+
+        def bump():
+            try:
+                cache.incr(key)
+            except ValueError:
+                if not cache.add(
+                    key, count, timeout=constants.ACTIVE_SESSION_CACHE_TIMEOUT
+                ):
+                    # Seeded by a concurrent login in the meantime
+                    with suppress(ValueError):
+                        cache.incr(key)
+
+        transaction.on_commit(bump)
+
+    @staticmethod
+    def forget(*user_ids) -> None:
+        """Drop cached counts for users whose sessions were revoked."""
+        keys = [SessionCacheService._key(user_id) for user_id in user_ids]
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,55 @@
+"""
+Token Cache Service
+
+Remembers tokens that can no longer be redeemed (used or expired) so that
+repeated clicks on the same link are rejected without a database query.
+Only terminal states are cached: a valid token always goes to the database,
+where it is locked and consumed.
+"""
+
+from typing import Optional
+from django.core.cache import cache
+from django.db import transaction
+from apps.accounts import constants
+
+
+class TokenCacheService:
+    """Cache of rejection messages for dead tokens"""
+
+    @staticmethod
+    def _key(kind: str, token) -> str:
+        return f"{constants.DEAD_TOKEN_CACHE_PREFIX}:{kind}:{token}"
+
+    @staticmethod
+    def get_rejection(kind: str, token) -> Optional[str]:
+        """
+        Get the cached rejection message for a token.
+
+        Args:
+            kind: Token type (e.g. "verify", "reset", "email_change")
+            token: Token value
+
+        Returns:
+            Rejection message, or None if the token must be checked in the DB
+        """
+        return cache.get(TokenCacheService._key(kind, token))
+
+    @staticmethod
+    def remember_rejection(kind: str, token, message: str) -> None:
+        """Cache the rejection message for a token that is used or expired."""
+        cache.set(
+            TokenCacheService._key(kind, token),
+            message,
+            timeout=constants.DEAD_TOKEN_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def remember_consumed(kind: str, token, message: str) -> None:
+        """
+        Cache the rejection for a token consumed in the current transaction.
+
+        Deferred to commit so a rolled-back redemption is not remembered.
+        """
+        transaction.on_commit(
+            lambda: TokenCacheService.remember_rejection(kind, token, message)
+        )
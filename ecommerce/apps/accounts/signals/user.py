@@ -3,21 +3,25 @@ from django.dispatch import receiver
 from apps.accounts.models import User, AdminProfile, ShopKeeperProfile, CustomerProfile
 
 
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=User, dispatch_uid="accounts_create_user_profile")
 def create_user_profile(sender, instance, created, **kwargs):
     """
     Automatically create the appropriate profile when a new user is created.
 
     Note: We use .create() instead of .get_or_create() since this only runs
     when created=True, ensuring we only create the profile once.
+
+    Field values passed to UserManager.create_user(profile_data=...) are
+    used for the INSERT, so callers don't need a follow-up UPDATE.
     """
     if kwargs.get("raw"):
         return
 
     if created:
+        profile_data = getattr(instance, "_profile_data", {})
         if instance.role == User.Role.ADMIN:
-            AdminProfile.objects.create(user=instance)
+            AdminProfile.objects.create(user=instance, **profile_data)
         elif instance.role == User.Role.SHOPKEEPER:
-            ShopKeeperProfile.objects.create(user=instance)
+            ShopKeeperProfile.objects.create(user=instance, **profile_data)
         elif instance.role == User.Role.CUSTOMER:
-            CustomerProfile.objects.create(user=instance)
+            CustomerProfile.objects.create(user=instance, **profile_data)
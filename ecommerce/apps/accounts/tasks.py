@@ -0,0 +1,204 @@
+"""
+Background Tasks for Accounts App
+
+Celery tasks for work that should not block the request thread (SMTP, etc.).
+"""
+
+from contextlib import suppress
+from smtplib import SMTPException
+from datetime import timedelta
+from celery import group, shared_task
+from django.apps import apps
+from django.core import mail
+from django.db import OperationalError
+from django.utils import timezone
+from apps.accounts.models import (
+    AuditLog,
+    EmailChangeToken,
+    EmailVerificationToken,
+    PasswordResetToken,
+    User,
+    UserSession,
+)
+from apps.accounts.services import EmailService
+from apps.accounts import constants
+
+
+@shared_task(
+    autoretry_for=(SMTPException, ConnectionError),
+    retry_backoff=True,
+    max_retries=constants.EMAIL_TASK_MAX_RETRIES,
+)
+def send_verification_email_task(user_id):
+    """
+    Send the verification email for a user.
+
+    Takes the user's id rather than the instance so the task payload stays
+    serializable; skips silently if the user was deleted before it ran.
+
+    Args:
+        user_id: Primary key of the user to verify
+    """
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or user.email_verified:
+        return
+
+    EmailService.send_verification_email(user)
+
+
+@shared_task(bind=True, max_retries=constants.EMAIL_TASK_MAX_RETRIES)
+def send_verification_emails_task(self, user_ids):
+    """
+    Send verification emails to several users over one SMTP connection.
+
+    Opening the connection (TLS handshake and AUTH) once per batch rather
+    than once per email is what makes bulk sends cheap. Users verified or
+    deleted before the task ran are skipped. Failed sends are retried per
+    recipient: the retry carries only the users whose email failed, so
+    nobody who already got one is mailed again.
+
+    Args:
+        user_ids: Primary keys of the users to verify
+    """
+    users = User.objects.light().filter(pk__in=user_ids, email_verified=False)
+    connection = mail.get_connection()
+    try:
+        connection.open()
+    except (SMTPException, ConnectionError) as exc:
+        # Nobody has been mailed yet, so the whole batch is retried
+        raise self.retry(exc=exc, countdown=2**self.request.retries)
+
+    failed = []
+    error = None
+    try:
+        for user in users:
+            try:
+                EmailService.send_verification_email(user, connection=connection)
+            except (SMTPException, ConnectionError) as exc:
+                failed.append(user.pk)
+                error = exc
+    finally:
+        # Every email has been attempted; a failed QUIT changes nothing
+        with suppress(SMTPException, ConnectionError):
+            connection.close()
+
+    if failed:
+        raise self.retry(args=[failed], exc=error, countdown=2**self.request.retries)
+
+
+def send_bulk_verification_emails(user_ids):
+    """
+    Queue verification emails for many users at once.
+
+    Users are split into batches of EMAIL_BATCH_SIZE, each sent by one
+    task over a single SMTP connection. The batches are published as one
+    group, so every message goes out over a single producer connection.
+
+    Args:
+        user_ids: Primary keys of the users to verify
+    """
+    size = constants.EMAIL_BATCH_SIZE
+    group(
+        send_verification_emails_task.s(user_ids[start : start + size])
+        for start in range(0, len(user_ids), size)
+    ).apply_async()
+
+
+@shared_task(
+    autoretry_for=(SMTPException, ConnectionError),
+    retry_backoff=True,
+    max_retries=constants.EMAIL_TASK_MAX_RETRIES,
+)
+def send_password_reset_email_task(user_id, reset_url, expiry_hours):
+    """
+    Send a password reset link to a user.
+
+    Args:
+        user_id: Primary key of the user who requested the reset
+        reset_url: Frontend URL carrying the reset token
+        expiry_hours: Token lifetime quoted in the email
+    """
+    user = User.objects.light().filter(pk=user_id).first()
+    if user is None:
+        return
+
+    EmailService.send_password_reset_email(user, reset_url, expiry_hours)
+
+
+@shared_task(
+    autoretry_for=(SMTPException, ConnectionError),
+    retry_backoff=True,
+    max_retries=constants.EMAIL_TASK_MAX_RETRIES,
+)
+def send_email_change_email_task(new_email, verification_url, expiry_hours):
+    """
+    Send the email change confirmation link to the new address.
+
+    Args:
+        new_email: Address the user wants to switch to
+        verification_url: Frontend URL carrying the change token
+        expiry_hours: Token lifetime quoted in the email
+    """
+    EmailService.send_email_change_email(new_email, verification_url, expiry_hours)
+
+
+@shared_task(
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    max_retries=constants.AUDIT_TASK_MAX_RETRIES,
+)
+def record_audit_log_task(
+    user_id, action, ip_address=None, user_agent="", metadata=None
+):
+    """
+    Write one audit log row outside the request that produced it.
+
+    Uses the same signal-free bulk_create insert as AuditService; transient
+    database errors (lock timeouts, failovers) are retried with backoff.
+
+    Args:
+        user_id: Primary key of the user the event is about
+        action: Audit action name
+        ip_address: Client IP of the originating request
+        user_agent: User agent of the originating request
+        metadata: Extra JSON details for the event
+    """
+    AuditLog.objects.bulk_create(
+        [
+            AuditLog(
+                user_id=user_id,
+                action=action,
+                ip_address=ip_address,
+                user_agent=user_agent or "",
+                metadata=metadata or {},
+            )
+        ]
+    )
+
+
+@shared_task
+def purge_expired_token_model_task(model_label, batch_size):
+    """Delete expired tokens of one token model past the retention period."""
+    cutoff = timezone.now() - timedelta(days=constants.TOKEN_RETENTION_DAYS)
+    return apps.get_model(model_label).objects.purge_expired(cutoff, batch_size)
+
+
+@shared_task
+def purge_expired_tokens_task(batch_size=constants.TOKEN_PURGE_BATCH_SIZE):
+    """
+    Delete expired tokens past the retention period (scheduled hourly).
+
+    The token tables are independent, so each is purged by its own
+    subtask and idle workers can run them concurrently.
+    """
+    group(
+        purge_expired_token_model_task.s(model._meta.label, batch_size)
+        for model in (EmailVerificationToken, PasswordResetToken, EmailChangeToken)
+    ).apply_async()
+
+
+@shared_task
+def purge_inactive_sessions_task(batch_size=constants.SESSION_PURGE_BATCH_SIZE):
+    """Delete revoked sessions past the retention period (scheduled hourly)."""
+    cutoff = timezone.now() - timedelta(days=constants.SESSION_RETENTION_DAYS)
+    return UserSession.objects.purge_inactive(cutoff, batch_size)
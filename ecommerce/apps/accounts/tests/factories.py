@@ -5,6 +5,8 @@ Reusable factories for creating test users and profiles.
 """
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from apps.accounts.models import CustomerProfile
 
 User = get_user_model()
 
@@ -33,23 +35,49 @@ class UserFactory:
         if email is None:
             email = f"customer{unique_id}@test.com"
 
-        user = User.objects.create_user(
+        # Flags and profile fields go into the INSERTs, no follow-up saves
+        return User.objects.create_user(
             email=email,
             phone=f"+9198765432{unique_id:02d}",
             password=password,
             role=User.Role.CUSTOMER,
+            is_active=is_active,
+            email_verified=email_verified,
+            profile_data={"full_name": full_name},
         )
-        user.is_active = is_active
-        user.email_verified = email_verified
-        user.save()
 
-        # Update profile - must refresh user instance first
-        user.refresh_from_db()
-        if hasattr(user, "customerprofile"):
-            user.customerprofile.full_name = full_name
-            user.customerprofile.save()
-
-        return user
+    @classmethod
+    def create_customers(
+        cls,
+        count: int,
+        password: str = "TestPass123!",
+        full_name: str = "Test Customer",
+        email_verified: bool = True,
+    ) -> list:
+        """
+        Create several test customers with two bulk INSERTs.
+
+        bulk_create() sends no post_save, so profiles are inserted here
+        and the password is hashed once for all users.
+        """
+        hashed_password = make_password(password)
+        users = []
+        for _ in range(count):
+            unique_id = cls._get_unique_id()
+            users.append(
+                User(
+                    email=f"customer{unique_id}@test.com",
+                    phone=f"+9198765432{unique_id:02d}",
+                    password=hashed_password,
+                    role=User.Role.CUSTOMER,
+                    email_verified=email_verified,
+                )
+            )
+        User.objects.bulk_create(users)
+        CustomerProfile.objects.bulk_create(
+            CustomerProfile(user=user, full_name=full_name) for user in users
+        )
+        return users
 
     @classmethod
     def create_shopkeeper(
@@ -68,24 +96,18 @@ class UserFactory:
         if gst_number is None:
             gst_number = f"22AAAAA{unique_id:04d}A1Z5"
 
-        user = User.objects.create_user(
+        return User.objects.create_user(
             email=email,
             phone=f"+9187654321{unique_id:02d}",
             password=password,
             role=User.Role.SHOPKEEPER,
+            is_active=is_active,
+            profile_data={
+                "shop_name": shop_name,
+                "gst_number": gst_number,
+                "is_verified": is_verified,
+            },
         )
-        user.is_active = is_active
-        user.save()
-
-        # Update profile - must refresh user instance first
-        user.refresh_from_db()
-        if hasattr(user, "shopkeeperprofile"):
-            user.shopkeeperprofile.shop_name = shop_name
-            user.shopkeeperprofile.gst_number = gst_number
-            user.shopkeeperprofile.is_verified = is_verified
-            user.shopkeeperprofile.save()
-
-        return user
 
     @classmethod
     def create_admin(
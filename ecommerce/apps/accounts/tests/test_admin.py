@@ -0,0 +1,245 @@
+"""
+Tests for Account Admin
+
+Tests for admin actions, search and changelist display.
+"""
+
+from unittest.mock import patch
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from apps.accounts import constants
+from apps.accounts.admin import (
+    EmailVerificationTokenAdmin,
+    ShopKeeperProfileAdmin,
+    UserAdmin,
+    UserSessionAdmin,
+)
+from apps.accounts.models import (
+    AuditLog,
+    EmailVerificationToken,
+    ShopKeeperProfile,
+    UserAgent,
+    UserSession,
+)
+from apps.accounts.tests.factories import UserFactory
+from apps.common import utils
+from apps.common.utils import update_returning
+
+User = get_user_model()
+
+
+@patch("django.contrib.admin.ModelAdmin.message_user")
+class AdminActionAuditTest(TestCase):
+    """Test cases for audited bulk admin actions."""
+
+    def setUp(self):
+        self.site = AdminSite()
+        self.admin_user = UserFactory.create_admin()
+        self.request = RequestFactory().post("/admin/", HTTP_USER_AGENT="Test Agent")
+        self.request.user = self.admin_user
+
+    def test_verify_emails_logs_each_changed_user(self, message_user):
+        """Test that only users actually verified get an audit entry."""
+        unverified = UserFactory.create_customer(email_verified=False)
+        verified = UserFactory.create_customer(email_verified=True)
+
+        UserAdmin(User, self.site).verify_emails(
+            self.request, User.objects.filter(pk__in=[unverified.pk, verified.pk])
+        )
+
+        unverified.refresh_from_db()
+        self.assertTrue(unverified.email_verified)
+        logs = AuditLog.objects.filter(action=constants.AUDIT_ACTION_EMAIL_VERIFICATION)
+        self.assertEqual(list(logs.values_list("user_id", flat=True)), [unverified.pk])
+        self.assertEqual(logs.get().metadata["performed_by"], self.admin_user.email)
+        message_user.assert_called_once_with(
+            self.request, "1 user(s) verified successfully."
+        )
+
+    def test_resend_verification_emails_skips_verified(self, message_user):
+        """Test that emails are queued only for unverified users."""
+        unverified = UserFactory.create_customer(email_verified=False)
+        verified = UserFactory.create_customer(email_verified=True)
+
+        UserAdmin(User, self.site).resend_verification_emails(
+            self.request, User.objects.filter(pk__in=[unverified.pk, verified.pk])
+        )
+
+        self.assertEqual([m.to for m in mail.outbox], [[unverified.email]])
+        self.assertTrue(EmailVerificationToken.objects.filter(user=unverified).exists())
+        message_user.assert_called_once_with(
+            self.request, "Verification email queued for 1 user(s)."
+        )
+
+    def test_verify_shops_logs_profile_update(self, message_user):
+        """Test that shop verification is logged against the shop owner."""
+        shopkeeper = UserFactory.create_shopkeeper(is_verified=False)
+
+        ShopKeeperProfileAdmin(ShopKeeperProfile, self.site).verify_shops(
+            self.request, ShopKeeperProfile.objects.filter(user=shopkeeper)
+        )
+
+        self.assertTrue(ShopKeeperProfile.objects.get(user=shopkeeper).is_verified)
+        log = AuditLog.objects.get(action=constants.AUDIT_ACTION_PROFILE_UPDATE)
+        self.assertEqual(log.user, shopkeeper)
+        self.assertEqual(log.metadata["changes"], {"is_verified": True})
+
+    def test_invalidate_sessions_logs_session_id(self, message_user):
+        """Test that each revoked session is logged with its id."""
+        user = UserFactory.create_customer()
+        session = UserSession.objects.create(
+            user=user,
+            session_key="admin_test_session_key",
+            user_agent=UserAgent.objects.intern("Test Agent"),
+            ip_address="127.0.0.1",
+        )
+
+        UserSessionAdmin(UserSession, self.site).invalidate_sessions(
+            self.request, UserSession.objects.all()
+        )
+
+        session.refresh_from_db()
+        self.assertFalse(session.is_active)
+        log = AuditLog.objects.get(action=constants.AUDIT_ACTION_SESSION_REVOKED)
+        self.assertEqual(log.user, user)
+        self.assertEqual(log.metadata["session_id"], str(session.pk))
+
+
+class UpdateReturningTest(TestCase):
+    """Test cases for the UPDATE ... RETURNING helper behind admin actions."""
+
+    def test_returned_values_match_orm_types(self):
+        """Test that RETURNING rows go through the ORM's converters."""
+        users = UserFactory.create_customers(2, email_verified=False)
+        UserFactory.create_customer(email_verified=True)
+        fields = ("pk", "email_verified", "created_at")
+
+        returned = update_returning(
+            User.objects.filter(email_verified=False), fields, email_verified=True
+        )
+
+        self.assertEqual(
+            sorted(returned),
+            sorted(
+                User.objects.filter(pk__in=[u.pk for u in users]).values_list(*fields)
+            ),
+        )
+
+    def test_fallback_without_returning_support(self):
+        """Test that backends without UPDATE ... RETURNING read the rows first."""
+        user = UserFactory.create_customer(email_verified=False)
+
+        with patch.object(utils, "supports_update_returning", return_value=False):
+            returned = update_returning(
+                User.objects.filter(pk=user.pk), ("pk",), email_verified=True
+            )
+
+        self.assertEqual(returned, [(user.pk,)])
+        user.refresh_from_db()
+        self.assertTrue(user.email_verified)
+
+
+class EmailVerificationTokenAdminTest(TestCase):
+    """Test cases for the verification token changelist."""
+
+    def setUp(self):
+        self.model_admin = EmailVerificationTokenAdmin(
+            EmailVerificationToken, AdminSite()
+        )
+        self.request = RequestFactory().get("/admin/")
+        self.user = UserFactory.create_customer()
+        self.token = EmailVerificationToken.objects.create(user=self.user)
+        EmailVerificationToken.objects.create(user=self.user)
+
+    def test_search_by_full_token(self):
+        """Test that a full token matches exactly that token."""
+        queryset, may_have_duplicates = self.model_admin.get_search_results(
+            self.request,
+            EmailVerificationToken.objects.all(),
+            str(self.token.token),
+        )
+
+        self.assertEqual(list(queryset), [self.token])
+        self.assertFalse(may_have_duplicates)
+
+    def test_search_by_email(self):
+        """Test that non-token search terms still match the user email."""
+        queryset, _ = self.model_admin.get_search_results(
+            self.request, EmailVerificationToken.objects.all(), self.user.email
+        )
+
+        self.assertEqual(queryset.count(), 2)
+
+    def test_token_is_truncated_in_list(self):
+        """Test that only a token prefix is rendered."""
+        self.assertEqual(
+            self.model_admin.token_prefix(self.token),
+            f"{str(self.token.token)[:8]}…",
+        )
+
+
+class UserAdminChangelistTest(TestCase):
+    """Test cases for the user changelist queryset."""
+
+    def setUp(self):
+        self.admin_user = UserFactory.create_admin()
+        self.client.force_login(self.admin_user)
+        UserFactory.create_customer()
+
+    def test_changelist_loads_only_displayed_columns(self):
+        """Test that the changelist defers columns it does not render."""
+        response = self.client.get(reverse("admin:accounts_user_changelist"))
+
+        self.assertEqual(response.status_code, 200)
+        user = response.context["cl"].result_list[0]
+        self.assertIn("password", user.get_deferred_fields())
+
+    def test_change_form_loads_all_columns(self):
+        """Test that the change form still gets a fully loaded user."""
+        response = self.client.get(
+            reverse("admin:accounts_user_change", args=[self.admin_user.pk])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["original"].get_deferred_fields(), set())
+
+
+class UserAdminSearchTest(TestCase):
+    """Test cases for the user changelist search."""
+
+    def setUp(self):
+        self.model_admin = UserAdmin(User, AdminSite())
+        self.request = RequestFactory().get("/admin/")
+        self.user = UserFactory.create_customer(email="jane.smith@gmail.com")
+        UserFactory.create_customer(email="other@example.com")
+
+    def search(self, term):
+        queryset, _ = self.model_admin.get_search_results(
+            self.request, User.objects.all(), term
+        )
+        return list(queryset)
+
+    def test_email_prefix(self):
+        """Test that an email-like term is lower-cased and matched by prefix."""
+        self.assertEqual(self.search("Jane.Smith@"), [self.user])
+
+    def test_email_without_prefix_match_uses_substring_search(self):
+        """Test that an email term with no prefix match falls back to substring."""
+        self.assertEqual(self.search("smith@gmail"), [self.user])
+
+    def test_phone_prefix(self):
+        """Test that an E164 term matches the stored phone by prefix."""
+        self.assertEqual(self.search(str(self.user.phone)), [self.user])
+
+    def test_substring_and_domain_search(self):
+        """Test that other terms keep the default substring search."""
+        self.assertEqual(self.search("smith"), [self.user])
+        self.assertEqual(self.search("gmail.com"), [self.user])
+        self.assertEqual(self.search("@gmail.com"), [self.user])
+
+    def test_local_phone_number(self):
+        """Test that a number typed without the country code still matches."""
+        self.assertEqual(self.search(self.user.phone[3:]), [self.user])
@@ -4,11 +4,17 @@ Tests for Account API Endpoints
 Comprehensive tests for registration, login, profile, and session endpoints.
 """
 
+from django.core import mail
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from apps.accounts.models import UserSession
+from apps.accounts.serializers.login import LoginSerializer
+from apps.accounts.serializers.register import CustomerRegistrationSerializer
+from apps.accounts.services import AuthService
 from apps.accounts.tests.factories import UserFactory
 
 User = get_user_model()
@@ -17,9 +23,12 @@ User = get_user_model()
 class CustomerRegistrationAPITest(TestCase):
     """Test cases for customer registration endpoint."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("register_customer")
+
     def setUp(self):
         self.client = APIClient()
-        self.url = reverse("register_customer")
 
     def test_register_customer_success(self):
         """Test successful customer registration."""
@@ -38,6 +47,26 @@ class CustomerRegistrationAPITest(TestCase):
         self.assertIn("user", response.data)
         self.assertEqual(response.data["user"]["email"], "newcustomer@example.com")
 
+    def test_register_customer_sends_verification_email(self):
+        """Test that the verification email is queued once the user is committed."""
+        data = {
+            "email": "verifyme@example.com",
+            "phone": "+919876543211",
+            "password": "SecurePass123!",
+            "password_confirm": "SecurePass123!",
+            "full_name": "Verify Me",
+        }
+
+        # Don't spend the auth throttle quota of the tests that follow
+        self.addCleanup(cache.clear)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["verifyme@example.com"])
+
     def test_register_customer_duplicate_email(self):
         """Test registration with duplicate email fails."""
         UserFactory.create_customer(email="existing@example.com")
@@ -93,12 +122,45 @@ class CustomerRegistrationAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class CachedSerializerFieldsTest(TestCase):
+    """Test cases for serializers that reuse per-class field templates."""
+
+    def test_instances_bind_their_own_fields(self):
+        """Test that cached fields are copied and bound per instance."""
+        first = CustomerRegistrationSerializer()
+        second = CustomerRegistrationSerializer()
+
+        for name, field in first.fields.items():
+            self.assertIsNot(field, second.fields[name])
+            self.assertIs(field.parent, first)
+            self.assertIs(second.fields[name].parent, second)
+
+    def test_validation_is_independent(self):
+        """Test that errors on one instance do not leak into another."""
+        invalid = CustomerRegistrationSerializer(data={"email": "not-an-email"})
+        self.assertFalse(invalid.is_valid())
+
+        valid = CustomerRegistrationSerializer(
+            data={
+                "email": "cached@example.com",
+                "phone": "+919876543211",
+                "password": "SecurePass123!",
+                "password_confirm": "SecurePass123!",
+                "full_name": "Cached Fields",
+            }
+        )
+        self.assertTrue(valid.is_valid(), valid.errors)
+
+
 class ShopkeeperRegistrationAPITest(TestCase):
     """Test cases for shopkeeper registration endpoint."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("register_shopkeeper")
+
     def setUp(self):
         self.client = APIClient()
-        self.url = reverse("register_shopkeeper")
 
     def test_register_shopkeeper_success(self):
         """Test successful shopkeeper registration."""
@@ -133,13 +195,16 @@ class ShopkeeperRegistrationAPITest(TestCase):
 class LoginAPITest(TestCase):
     """Test cases for login endpoint."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.url = reverse("login")
-        self.user = UserFactory.create_customer(
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("login")
+        cls.user = UserFactory.create_customer(
             email="login@example.com", password="TestPass123!"
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_login_success(self):
         """Test successful login."""
         data = {"email": "login@example.com", "password": "TestPass123!"}
@@ -151,6 +216,30 @@ class LoginAPITest(TestCase):
         self.assertIn("refresh", response.data)
         self.assertIn("user", response.data)
 
+    def test_login_session_keyed_to_returned_token(self):
+        """Test that the session tracks the refresh token sent to the client."""
+        # Don't spend the auth throttle quota of the tests that follow
+        self.addCleanup(cache.clear)
+        data = {"email": "login@example.com", "password": "TestPass123!"}
+
+        response = self.client.post(self.url, data, format="json")
+
+        session = UserSession.objects.get(pk=response.data["session_id"])
+        self.assertEqual(
+            session.session_key, UserSession.key_for_token(response.data["refresh"])
+        )
+
+    def test_login_serializer_single_query(self):
+        """Test that validating credentials costs exactly one query."""
+        serializer = LoginSerializer(
+            data={"email": "login@example.com", "password": "TestPass123!"}
+        )
+
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid())
+
+        self.assertIn("access", serializer.validated_data)
+
     def test_login_wrong_password(self):
         """Test login with wrong password."""
         data = {"email": "login@example.com", "password": "WrongPassword123!"}
@@ -182,10 +271,13 @@ class LoginAPITest(TestCase):
 class ProfileAPITest(TestCase):
     """Test cases for profile endpoint."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("profile")
+        cls.user = UserFactory.create_customer(full_name="Test User")
+
     def setUp(self):
         self.client = APIClient()
-        self.url = reverse("profile")
-        self.user = UserFactory.create_customer(full_name="Test User")
 
     def test_get_profile_authenticated(self):
         """Test getting profile when authenticated."""
@@ -196,6 +288,36 @@ class ProfileAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["email"], self.user.email)
 
+    def test_get_profile_with_access_token(self):
+        """Test that JWT authentication loads the user without the password."""
+        access = AuthService.get_tokens_for_user(self.user)["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("password", response.wsgi_request.user.get_deferred_fields())
+
+    def test_get_profile_query_count(self):
+        """Test that the profile and addresses are loaded in fixed queries."""
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["profile"]["full_name"], "Test User")
+
+    def test_get_profile_without_addresses(self):
+        """Test that addresses are skipped when the client opts out."""
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"addresses": "false"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["addresses"])
+
     def test_get_profile_unauthenticated(self):
         """Test getting profile without authentication fails."""
         response = self.client.get(self.url)
@@ -211,18 +333,37 @@ class ProfileAPITest(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_update_profile_writes_changes(self):
+        """Test that profile edits are saved and reflected in the response."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.patch(
+            self.url,
+            {"full_name": "Updated Name", "phone": "+919812345678"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["profile"]["full_name"], "Updated Name")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.phone, "+919812345678")
+        self.assertEqual(self.user.customerprofile.full_name, "Updated Name")
+
 
 class TokenRefreshAPITest(TestCase):
     """Test cases for token refresh endpoint."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.refresh_url = reverse("token_refresh")
-        self.login_url = reverse("login")
-        self.user = UserFactory.create_customer(
+    @classmethod
+    def setUpTestData(cls):
+        cls.refresh_url = reverse("token_refresh")
+        cls.login_url = reverse("login")
+        cls.user = UserFactory.create_customer(
             email="refresh@example.com", password="TestPass123!"
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_token_refresh_success(self):
         """Test successful token refresh."""
         # First login to get tokens
@@ -253,10 +394,13 @@ class TokenRefreshAPITest(TestCase):
 class SessionsAPITest(TestCase):
     """Test cases for session management endpoints."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.sessions_url = reverse("active_sessions")
+        cls.user = UserFactory.create_customer()
+
     def setUp(self):
         self.client = APIClient()
-        self.sessions_url = reverse("active_sessions")
-        self.user = UserFactory.create_customer()
 
     def test_list_sessions_authenticated(self):
         """Test listing sessions when authenticated."""
@@ -4,9 +4,21 @@ Tests for Account Models
 Comprehensive tests for User, CustomerProfile, and ShopkeeperProfile models.
 """
 
+import time
+from datetime import timedelta
 from django.test import TestCase
+from django.utils import timezone
 from django.contrib.auth import get_user_model
-from apps.accounts.models import CustomerProfile, ShopKeeperProfile, UserSession
+from apps.accounts import constants
+from apps.accounts.models import (
+    CustomerProfile,
+    EmailChangeToken,
+    PasswordResetToken,
+    ShopKeeperProfile,
+    SocialAccount,
+    UserAgent,
+    UserSession,
+)
 from apps.accounts.tests.factories import UserFactory
 
 User = get_user_model()
@@ -72,6 +84,15 @@ class UserModelTest(TestCase):
                 role=User.Role.CUSTOMER,
             )
 
+    def test_primary_keys_are_time_ordered(self):
+        """Test that user ids are UUIDv7 and sort in creation order."""
+        first = UserFactory.create_customer()
+        time.sleep(0.002)
+        second = UserFactory.create_customer()
+
+        self.assertEqual(first.id.version, 7)
+        self.assertLess(first.id, second.id)
+
 
 class CustomerProfileTest(TestCase):
     """Test cases for CustomerProfile model."""
@@ -115,6 +136,41 @@ class ShopkeeperProfileTest(TestCase):
         user = UserFactory.create_shopkeeper(is_verified=False)
         self.assertFalse(user.shopkeeperprofile.is_verified)
 
+    def test_profile_data_written_on_insert(self):
+        """Test that profile_data is saved without a follow-up update."""
+        with self.assertNumQueries(2):
+            user = User.objects.create_user(
+                email="shop@example.com",
+                phone="+919876543201",
+                password="TestPass123!",
+                role=User.Role.SHOPKEEPER,
+                profile_data={"shop_name": "My Shop", "gst_number": "22AAAAA0001A1Z5"},
+            )
+
+        profile = ShopKeeperProfile.objects.get(user=user)
+        self.assertEqual(profile.shop_name, "My Shop")
+        self.assertEqual(profile.gst_number, "22AAAAA0001A1Z5")
+
+
+class SocialAccountTest(TestCase):
+    """Test cases for SocialAccount model."""
+
+    def test_provider_email_copied_from_extra_data(self):
+        """Test that the provider email is kept in sync with extra_data."""
+        account = SocialAccount.objects.create(
+            user=UserFactory.create_customer(),
+            provider="google",
+            uid="google-uid",
+            extra_data={"email": "social@example.com"},
+        )
+        self.assertEqual(account.provider_email, "social@example.com")
+
+        account.extra_data = {}
+        account.save(update_fields=["extra_data"])
+
+        account.refresh_from_db()
+        self.assertIsNone(account.provider_email)
+
 
 class UserSessionTest(TestCase):
     """Test cases for UserSession model."""
@@ -125,7 +181,7 @@ class UserSessionTest(TestCase):
         session = UserSession.objects.create(
             user=user,
             session_key="test_session_key_123",
-            user_agent="Mozilla/5.0",
+            user_agent=UserAgent.objects.intern("Mozilla/5.0"),
             ip_address="127.0.0.1",
         )
 
@@ -133,13 +189,22 @@ class UserSessionTest(TestCase):
         self.assertTrue(session.is_active)
         self.assertIsNotNone(session.created_at)
 
+    def test_user_agent_is_deduplicated(self):
+        """Test that sessions with the same user agent share one row."""
+        first = UserAgent.objects.intern("Mozilla/5.0")
+        second = UserAgent.objects.intern("Mozilla/5.0")
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(UserAgent.objects.count(), 1)
+        self.assertNotEqual(UserAgent.objects.intern("curl/8.0").pk, first.pk)
+
     def test_session_revoke(self):
         """Test revoking a session."""
         user = UserFactory.create_customer()
         session = UserSession.objects.create(
             user=user,
             session_key="test_session_key_456",
-            user_agent="Test Agent",
+            user_agent=UserAgent.objects.intern("Test Agent"),
             ip_address="127.0.0.1",
         )
 
@@ -147,3 +212,151 @@ class UserSessionTest(TestCase):
 
         session.refresh_from_db()
         self.assertFalse(session.is_active)
+
+    def test_session_revoke_only_once(self):
+        """Test that revoking an inactive session reports no change."""
+        user = UserFactory.create_customer()
+        session = UserSession.objects.create(
+            user=user,
+            session_key="test_session_key_789",
+            user_agent=UserAgent.objects.intern("Test Agent"),
+            ip_address="127.0.0.1",
+        )
+
+        self.assertTrue(session.invalidate())
+        self.assertFalse(session.invalidate())
+
+    def test_update_activity_is_throttled(self):
+        """Test that last_activity is only written once per interval."""
+        user = UserFactory.create_customer()
+        session = UserSession.objects.create(
+            user=user,
+            session_key="test_session_key_activity",
+            user_agent=UserAgent.objects.intern("Test Agent"),
+            ip_address="127.0.0.1",
+        )
+
+        self.assertFalse(session.update_activity())
+
+        stale = timezone.now() - timedelta(
+            seconds=constants.SESSION_ACTIVITY_UPDATE_INTERVAL + 1
+        )
+        UserSession.objects.filter(pk=session.pk).update(last_activity=stale)
+
+        self.assertTrue(session.update_activity())
+        session.refresh_from_db()
+        self.assertGreater(session.last_activity, stale)
+
+    def test_purge_inactive_deletes_only_old_revoked_sessions(self):
+        """Test that active and recently revoked sessions are kept."""
+        user = UserFactory.create_customer()
+        user_agent = UserAgent.objects.intern("Test Agent")
+        sessions = [
+            UserSession.objects.create(
+                user=user, session_key=f"purge_{i}", user_agent=user_agent
+            )
+            for i in range(4)
+        ]
+        old = timezone.now() - timedelta(days=31)
+        UserSession.objects.filter(pk__in=[s.pk for s in sessions[:3]]).update(
+            last_activity=old
+        )
+        UserSession.objects.filter(
+            pk__in=[sessions[1].pk, sessions[2].pk, sessions[3].pk]
+        ).update(is_active=False)
+
+        # One DELETE per full batch, then an empty one; then the (still
+        # referenced) user agent is left alone
+        with self.assertNumQueries(4):
+            deleted = UserSession.objects.purge_inactive(
+                timezone.now() - timedelta(days=30), batch_size=1
+            )
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(
+            set(UserSession.objects.values_list("pk", flat=True)),
+            {sessions[0].pk, sessions[3].pk},
+        )
+
+    def test_purge_inactive_deletes_unused_user_agents(self):
+        """Test that user agents left without sessions are purged too."""
+        user = UserFactory.create_customer()
+        kept_agent = UserAgent.objects.intern("Kept Agent")
+        UserSession.objects.create(user=user, session_key="kept", user_agent=kept_agent)
+        UserSession.objects.create(
+            user=user,
+            session_key="purged",
+            user_agent=UserAgent.objects.intern("Random Agent"),
+            is_active=False,
+        )
+        UserSession.objects.filter(session_key="purged").update(
+            last_activity=timezone.now() - timedelta(days=31)
+        )
+        UserAgent.objects.intern("Never Used Agent")
+
+        UserSession.objects.purge_inactive(
+            timezone.now() - timedelta(days=30), batch_size=10
+        )
+
+        self.assertEqual(list(UserAgent.objects.all()), [kept_agent])
+
+
+class TokenQuerySetTest(TestCase):
+    """Test cases for the SQL-side token validity filter."""
+
+    def setUp(self):
+        self.user = UserFactory.create_customer()
+
+    def test_valid_excludes_used_and_expired(self):
+        """Test that only unused, unexpired tokens are valid."""
+        valid = PasswordResetToken.objects.create(user=self.user)
+        PasswordResetToken.objects.create(user=self.user, is_used=True)
+        PasswordResetToken.objects.create(
+            user=self.user, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        self.assertEqual(list(PasswordResetToken.objects.valid()), [valid])
+
+    def test_email_change_valid_requires_unchanged_email(self):
+        """Test that a token is invalid once the user's email changes."""
+        token = EmailChangeToken.objects.create(
+            user=self.user, new_email="new@example.com"
+        )
+        self.assertTrue(EmailChangeToken.objects.valid().filter(pk=token.pk).exists())
+
+        User.objects.filter(pk=self.user.pk).update(email="other@example.com")
+
+        self.assertFalse(EmailChangeToken.objects.valid().filter(pk=token.pk).exists())
+
+    def test_email_change_is_valid_without_loading_user(self):
+        """Test that is_valid checks the email without fetching the user."""
+        token = EmailChangeToken.objects.create(
+            user=self.user, new_email="new@example.com"
+        )
+        token = EmailChangeToken.objects.get(pk=token.pk)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(token.is_valid())
+        self.assertFalse(EmailChangeToken.user.is_cached(token))
+
+        User.objects.filter(pk=self.user.pk).update(email="other@example.com")
+        self.assertFalse(token.is_valid())
+
+    def test_purge_expired_deletes_in_batches(self):
+        """Test that only tokens expired before the cutoff are deleted."""
+        now = timezone.now()
+        for _ in range(3):
+            PasswordResetToken.objects.create(
+                user=self.user, expires_at=now - timedelta(days=31)
+            )
+        recent = PasswordResetToken.objects.create(
+            user=self.user, expires_at=now - timedelta(days=1)
+        )
+
+        with self.assertNumQueries(2):
+            deleted = PasswordResetToken.objects.purge_expired(
+                now - timedelta(days=30), batch_size=2
+            )
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(list(PasswordResetToken.objects.all()), [recent])
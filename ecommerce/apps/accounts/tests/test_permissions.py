@@ -0,0 +1,110 @@
+"""
+Tests for Account Permissions
+
+Tests for role lookup and the role-based permission classes.
+"""
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+from rest_framework.request import ForcedAuthentication, Request
+from apps.accounts.permissions import IsAdmin, IsAdminOrReadOnly, IsCustomer
+from apps.accounts.permissions.base import get_user_role
+from apps.accounts.models import User
+from apps.accounts.tests.factories import UserFactory
+
+
+class RolePermissionTest(TestCase):
+    """Test cases for role permissions for every role and anonymous users."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = {
+            "customer": UserFactory.create_customer(),
+            "shopkeeper": UserFactory.create_shopkeeper(),
+            "admin": UserFactory.create_admin(),
+            "anonymous": AnonymousUser(),
+        }
+
+    def _request(self, user, method="get"):
+        request = getattr(RequestFactory(), method)("/")
+        request.user = user
+        return request
+
+    def test_get_user_role(self):
+        """Test that each user maps to its role and anonymous to None."""
+        expected = {
+            "customer": User.Role.CUSTOMER,
+            "shopkeeper": User.Role.SHOPKEEPER,
+            "admin": User.Role.ADMIN,
+            "anonymous": None,
+        }
+        for name, user in self.users.items():
+            with self.subTest(user=name):
+                self.assertEqual(get_user_role(self._request(user)), expected[name])
+
+    def test_is_admin(self):
+        """Test that only admins pass IsAdmin."""
+        for name, user in self.users.items():
+            with self.subTest(user=name):
+                self.assertEqual(
+                    IsAdmin().has_permission(self._request(user), None),
+                    name == "admin",
+                )
+
+    def test_is_customer(self):
+        """Test that only customers pass IsCustomer."""
+        for name, user in self.users.items():
+            with self.subTest(user=name):
+                self.assertEqual(
+                    IsCustomer().has_permission(self._request(user), None),
+                    name == "customer",
+                )
+
+    def test_is_admin_or_read_only(self):
+        """Test that any signed-in user may read but only admins may write."""
+        for name, user in self.users.items():
+            with self.subTest(user=name):
+                permission = IsAdminOrReadOnly()
+                self.assertEqual(
+                    permission.has_permission(self._request(user), None),
+                    name != "anonymous",
+                )
+                self.assertEqual(
+                    permission.has_permission(self._request(user, "post"), None),
+                    name == "admin",
+                )
+
+    def test_role_memoized_on_request(self):
+        """Test that stacked permissions resolve request.user only once."""
+        request = self._request(self.users["customer"])
+        self.assertTrue(IsCustomer().has_permission(request, None))
+
+        # A later user swap is not seen; the memo answers
+        request.user = self.users["admin"]
+        self.assertFalse(IsAdmin().has_permission(request, None))
+        self.assertEqual(request._user_role, User.Role.CUSTOMER)
+
+
+class DRFRequestRoleTest(TestCase):
+    """Test cases for role lookup through DRF's Request wrapper."""
+
+    def setUp(self):
+        self.customer = UserFactory.create_customer()
+        self.http_request = RequestFactory().get("/")
+        self.http_request.user = AnonymousUser()
+        self.request = Request(
+            self.http_request,
+            authenticators=[ForcedAuthentication(self.customer, None)],
+        )
+
+    def test_wrapper_memo_not_shared_with_http_request(self):
+        """Test that the wrapper and the HttpRequest keep separate memos."""
+        self.assertEqual(get_user_role(self.request), User.Role.CUSTOMER)
+        self.assertNotIn("_user_role", vars(self.http_request))
+
+    def test_http_request_memo_not_read_through_wrapper(self):
+        """Test that an anonymous memo on the HttpRequest is not proxied."""
+        self.assertIsNone(get_user_role(self.http_request))
+
+        self.assertEqual(get_user_role(self.request), User.Role.CUSTOMER)
+        self.assertTrue(IsCustomer().has_permission(self.request, None))
@@ -0,0 +1,606 @@
+"""
+Tests for Account Services
+
+Tests for service-layer behaviour not covered through the API tests.
+"""
+
+import uuid
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.db import DatabaseError, OperationalError, connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from apps.accounts import constants
+from apps.accounts.middleware import AuditLogBufferMiddleware
+from apps.accounts.models import (
+    AuditLog,
+    EmailChangeToken,
+    EmailVerificationToken,
+    PasswordResetToken,
+    UserAgent,
+    UserSession,
+)
+from apps.accounts.utils import PrecompiledTemplate, get_client_ip
+from apps.accounts.services import AuditService, AuthService, EmailService
+from apps.accounts.services import email_service
+from apps.accounts.services.session_cache import SessionCacheService
+from apps.accounts.services.password_reset_service import (
+    EmailChangeService,
+    PasswordResetService,
+)
+from apps.accounts.tasks import (
+    purge_expired_tokens_task,
+    purge_inactive_sessions_task,
+    record_audit_log_task,
+    send_bulk_verification_emails,
+    send_verification_email_task,
+    send_verification_emails_task,
+)
+from apps.accounts.tests.factories import UserFactory
+
+User = get_user_model()
+
+
+class DeferredAuditLogTest(TestCase):
+    """Test cases for audit entries buffered until commit."""
+
+    def setUp(self):
+        self.request = RequestFactory().post("/", HTTP_USER_AGENT="Test Agent")
+
+    def _serve(self, log_events):
+        """Run log_events as a view under the buffering middleware."""
+
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                log_events(request)
+            # Committed entries wait for the middleware
+            self.assertFalse(AuditLog.objects.exists())
+            return HttpResponse()
+
+        AuditLogBufferMiddleware(view)(self.request)
+
+    def test_account_created_written_in_one_insert(self):
+        """Test that account creation logs are bulk inserted after the view."""
+        users = UserFactory.create_customers(3)
+
+        def log_events(request):
+            with transaction.atomic():
+                for user in users:
+                    AuditService.log_account_created(user, request)
+
+        with patch.object(
+            AuditLog.objects, "bulk_create", wraps=AuditLog.objects.bulk_create
+        ) as bulk_create:
+            self._serve(log_events)
+
+        bulk_create.assert_called_once()
+        self.assertEqual(
+            set(
+                AuditLog.objects.filter(
+                    action=constants.AUDIT_ACTION_ACCOUNT_CREATED
+                ).values_list("user_id", flat=True)
+            ),
+            {user.pk for user in users},
+        )
+
+    def test_written_on_commit_without_middleware(self):
+        """Test that each transaction writes its entries when not buffered."""
+        user = UserFactory.create_customer()
+
+        for _ in range(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                AuditService.log_account_created(user, self.request)
+
+        self.assertEqual(AuditLog.objects.filter(user=user).count(), 2)
+
+    def test_rolled_back_entries_discarded(self):
+        """Test that a rolled back savepoint neither drops nor leaks entries."""
+        kept, rolled_back, later = UserFactory.create_customers(3)
+
+        def log_events(request):
+            with transaction.atomic():
+                AuditService.log_account_created(kept, request)
+                try:
+                    with transaction.atomic():
+                        AuditService.log_account_created(rolled_back, request)
+                        raise DatabaseError
+                except DatabaseError:
+                    pass
+                AuditService.log_account_created(later, request)
+
+        self._serve(log_events)
+
+        self.assertEqual(
+            set(AuditLog.objects.values_list("user_id", flat=True)),
+            {kept.pk, later.pk},
+        )
+
+
+class DeferredAuditLogRollbackTest(TransactionTestCase):
+    """Test cases for audit entries logged around a rolled back transaction."""
+
+    def test_logging_after_rollback_is_flushed(self):
+        """Test that entries logged after a rollback on the same request are saved."""
+        request = RequestFactory().post("/", HTTP_USER_AGENT="Test Agent")
+        user = UserFactory.create_customer()
+
+        def view(request):
+            with transaction.atomic():
+                AuditService.log_account_created(user, request)
+                transaction.set_rollback(True)
+
+            with transaction.atomic():
+                AuditService.log_account_created(user, request)
+            return HttpResponse()
+
+        AuditLogBufferMiddleware(view)(request)
+
+        self.assertEqual(AuditLog.objects.filter(user=user).count(), 1)
+
+
+class SessionLimitTest(TestCase):
+    """Test cases for the per-user active session limit."""
+
+    def setUp(self):
+        self.user = UserFactory.create_customer()
+        self.request = RequestFactory().post("/", HTTP_USER_AGENT="Test Agent")
+        self.addCleanup(cache.clear)
+
+    def test_session_key_is_refresh_token_hash(self):
+        """Test that sessions store a fixed-size hash, not the refresh JWT."""
+        session, tokens = AuthService.create_session(self.user, self.request)
+
+        self.assertEqual(
+            session.session_key, UserSession.key_for_token(tokens["refresh"])
+        )
+        self.assertEqual(len(session.session_key), 32)
+
+    def test_oldest_session_evicted_at_limit(self):
+        """Test that a login past the limit invalidates the oldest session."""
+        limit = constants.MAX_ACTIVE_SESSIONS_PER_USER
+        sessions = [
+            AuthService.create_session(self.user, self.request)[0] for _ in range(limit)
+        ]
+        self.assertTrue(AuthService.has_max_active_sessions(self.user))
+
+        with self.assertNumQueries(4):
+            # limit check, eviction, user agent lookup and session insert
+            AuthService.create_session(self.user, self.request)
+
+        active = UserSession.objects.filter(user=self.user, is_active=True)
+        self.assertEqual(active.count(), limit)
+        self.assertFalse(active.filter(pk=sessions[0].pk).exists())
+
+    def test_limit_check_served_from_cache(self):
+        """Test that committed logins keep the cached count current."""
+        limit = constants.MAX_ACTIVE_SESSIONS_PER_USER
+        for _ in range(limit):
+            with self.captureOnCommitCallbacks(execute=True):
+                AuthService.create_session(self.user, self.request)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(AuthService.has_max_active_sessions(self.user))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuthService.invalidate_all_sessions(self.user)
+
+        with self.assertNumQueries(1):
+            self.assertFalse(AuthService.has_max_active_sessions(self.user))
+
+    def test_stale_cached_limit_confirmed_before_eviction(self):
+        """Test that a cached count at the limit does not evict on its own."""
+        with self.captureOnCommitCallbacks(execute=True):
+            session, _ = AuthService.create_session(self.user, self.request)
+        # Left at the limit by another worker that never saw the revokes
+        cache.set(
+            SessionCacheService._key(self.user.pk),
+            constants.MAX_ACTIVE_SESSIONS_PER_USER,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuthService.create_session(self.user, self.request)
+
+        session.refresh_from_db()
+        self.assertTrue(session.is_active)
+        self.assertEqual(SessionCacheService.get_count(self.user.pk), 2)
+
+    def test_login_increments_cached_count(self):
+        """Test that a login does not overwrite a concurrently updated count."""
+        with self.captureOnCommitCallbacks(execute=True):
+            AuthService.create_session(self.user, self.request)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuthService.create_session(self.user, self.request)
+            # A concurrent login commits after this one read the count
+            cache.incr(SessionCacheService._key(self.user.pk))
+
+        self.assertEqual(SessionCacheService.get_count(self.user.pk), 3)
+
+
+class RequestMetadataTest(TestCase):
+    """Test cases for per-request audit metadata."""
+
+    def test_metadata_parsed_once_per_request(self):
+        """Test that IP and user agent are extracted once per request."""
+        request = RequestFactory().get(
+            "/", HTTP_X_FORWARDED_FOR="203.0.113.5, 10.0.0.1", HTTP_USER_AGENT="UA"
+        )
+
+        with patch(
+            "apps.accounts.services.audit_service.get_client_ip",
+            return_value="203.0.113.5",
+        ) as get_client_ip:
+            first = AuditService._get_request_metadata(request)
+            second = AuditService._get_request_metadata(request)
+
+        self.assertEqual(first, ("203.0.113.5", "UA"))
+        self.assertEqual(first, second)
+        get_client_ip.assert_called_once_with(request)
+
+    def test_client_ip_cached_on_request(self):
+        """Test that the client IP is resolved once per request."""
+        request = RequestFactory().get("/", REMOTE_ADDR="198.51.100.7")
+
+        self.assertEqual(get_client_ip(request), "198.51.100.7")
+        request.META["REMOTE_ADDR"] = "198.51.100.8"
+        self.assertEqual(get_client_ip(request), "198.51.100.7")
+
+
+class EmailTemplateTest(TestCase):
+    """Test cases for precompiled email bodies."""
+
+    def test_renders_like_str_format(self):
+        """Test that precompiled templates match str.format output."""
+        context = {
+            "email": "user@example.com",
+            "new_email": "new@example.com",
+            "verification_url": "http://localhost:3000/verify-email/abc",
+            "reset_url": "http://localhost:3000/reset-password/abc",
+            "expiry_hours": 24,
+        }
+        templates = [
+            (email_service.VERIFICATION_EMAIL, constants.EMAIL_VERIFICATION_TEMPLATE),
+            (
+                email_service.PASSWORD_RESET_EMAIL,
+                constants.EMAIL_PASSWORD_RESET_TEMPLATE,
+            ),
+            (email_service.EMAIL_CHANGE_EMAIL, constants.EMAIL_CHANGE_TEMPLATE),
+        ]
+
+        for compiled, source in templates:
+            self.assertEqual(compiled.render(**context), source.format(**context))
+
+    def test_rejects_format_spec(self):
+        """Test that unsupported placeholders fail at build time."""
+        with self.assertRaises(ValueError):
+            PrecompiledTemplate("{expiry_hours:02d}")
+
+
+class QueuedEmailTest(TestCase):
+    """Test cases for emails sent through Celery after commit."""
+
+    def setUp(self):
+        self.user = UserFactory.create_customer(email="queued@example.com")
+        self.addCleanup(cache.clear)
+
+    def test_password_reset_email_sent_after_commit(self):
+        """Test that the reset email is only queued once the token commits."""
+        with self.captureOnCommitCallbacks(execute=True):
+            PasswordResetService.request_password_reset(self.user.email)
+            self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["queued@example.com"])
+
+    def test_password_reset_repeat_within_cooldown_skipped(self):
+        """Test that a repeated request in the cooldown does no DB work."""
+        PasswordResetService.request_password_reset(self.user.email)
+
+        with self.assertNumQueries(0):
+            success, _ = PasswordResetService.request_password_reset(
+                self.user.email.upper()
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(PasswordResetToken.objects.filter(user=self.user).count(), 1)
+
+    def test_password_reset_audit_written_after_commit(self):
+        """Test that the reset request audit row is written by the task."""
+        logs = AuditLog.objects.filter(user=self.user, action="PASSWORD_RESET_REQUEST")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PasswordResetService.request_password_reset(
+                self.user.email, ip_address="127.0.0.1", user_agent="Test Agent"
+            )
+            self.assertFalse(logs.exists())
+
+        log = logs.get()
+        self.assertEqual(log.ip_address, "127.0.0.1")
+        self.assertEqual(log.user_agent, "Test Agent")
+
+    def test_verification_retry_reuses_pending_token(self):
+        """Test that a retried verification send mails the same token."""
+        user = UserFactory.create_customer(email_verified=False)
+
+        with patch(
+            "apps.accounts.services.email_service.send_mail",
+            side_effect=[SMTPException("temporary failure"), 1],
+        ) as send_mail:
+            # With throw=False, apply() performs the retry inline
+            send_verification_email_task.apply(args=[user.pk], throw=False)
+
+        token = EmailVerificationToken.objects.get(user=user)
+        self.assertEqual(send_mail.call_count, 2)
+        for call in send_mail.call_args_list:
+            self.assertIn(str(token.token), call.args[1])
+
+    def test_bulk_verification_reuses_one_connection(self):
+        """Test that a batch of verification emails shares one connection."""
+        users = UserFactory.create_customers(3, email_verified=False)
+
+        with patch(
+            "apps.accounts.tasks.mail.get_connection", wraps=mail.get_connection
+        ) as get_connection:
+            send_bulk_verification_emails([user.pk for user in users])
+
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_bulk_verification_retries_only_failed_recipients(self):
+        """Test that a failed send is retried without re-mailing the others."""
+        users = UserFactory.create_customers(3, email_verified=False)
+        flaky = users[1].email
+        attempts = []
+
+        def send_mail(subject, message, from_email, recipient_list, **kwargs):
+            attempts.append(recipient_list[0])
+            if recipient_list == [flaky] and attempts.count(flaky) == 1:
+                raise SMTPException("temporary failure")
+            return 1
+
+        with patch("apps.accounts.services.email_service.send_mail", send_mail):
+            # With throw=False, apply() performs the retry inline
+            send_verification_emails_task.apply(
+                args=[[user.pk for user in users]], throw=False
+            )
+
+        self.assertEqual(sorted(attempts), sorted([*(u.email for u in users), flaky]))
+        self.assertEqual(attempts[-1], flaky)
+        self.assertEqual(
+            EmailVerificationToken.objects.filter(user__in=users).count(), 3
+        )
+
+    def test_email_change_email_sent_to_new_address(self):
+        """Test that the change confirmation goes to the new address."""
+        with self.captureOnCommitCallbacks(execute=True):
+            EmailChangeService.request_email_change(self.user, "changed@example.com")
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["changed@example.com"])
+
+
+class TokenConfirmationTest(TestCase):
+    """Test cases for consuming verification, reset and change tokens."""
+
+    def setUp(self):
+        self.user = UserFactory.create_customer(email_verified=False)
+        self.addCleanup(cache.clear)
+
+    def test_verify_email(self):
+        """Test that a verification token verifies the user once."""
+        token = EmailVerificationToken.objects.create(user=self.user)
+
+        success, _, user = EmailService.verify_email(token.token)
+        self.assertTrue(success)
+        self.assertTrue(user.email_verified)
+
+        success, message, _ = EmailService.verify_email(token.token)
+        self.assertFalse(success)
+        self.assertEqual(message, constants.EMAIL_LINK_USED)
+
+    def test_consumed_token_rejected_from_cache(self):
+        """Test that a consumed token is rejected without touching its table."""
+        token = EmailVerificationToken.objects.create(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            EmailService.verify_email(token.token)
+
+        with CaptureQueriesContext(connection) as queries:
+            success, message, _ = EmailService.verify_email(token.token)
+
+        self.assertFalse(success)
+        self.assertEqual(message, constants.EMAIL_LINK_USED)
+        self.assertFalse(
+            any("accounts_emailverificationtoken" in q["sql"] for q in queries)
+        )
+
+    def test_confirm_password_reset(self):
+        """Test that a reset token sets the password and is then rejected."""
+        token = PasswordResetToken.objects.create(user=self.user)
+
+        success, _ = PasswordResetService.confirm_password_reset(
+            token.token, "NewSecurePass123!"
+        )
+        self.assertTrue(success)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("NewSecurePass123!"))
+
+        success, message = PasswordResetService.confirm_password_reset(
+            token.token, "OtherPass123!"
+        )
+        self.assertFalse(success)
+        self.assertEqual(message, "This reset link has expired or already been used")
+
+    def test_lost_race_has_no_side_effects(self):
+        """Test that a caller whose mark_as_used() loses changes nothing."""
+        verification = EmailVerificationToken.objects.create(user=self.user)
+        reset = PasswordResetToken.objects.create(user=self.user)
+        change = EmailChangeToken.objects.create(
+            user=self.user, new_email="raced@example.com"
+        )
+
+        with patch.object(EmailVerificationToken, "mark_as_used", return_value=False):
+            success, _, _ = EmailService.verify_email(verification.token)
+        self.assertFalse(success)
+
+        with patch.object(PasswordResetToken, "mark_as_used", return_value=False):
+            success, _ = PasswordResetService.confirm_password_reset(
+                reset.token, "NewSecurePass123!"
+            )
+        self.assertFalse(success)
+
+        with patch.object(EmailChangeToken, "mark_as_used", return_value=False):
+            success, _ = EmailChangeService.confirm_email_change(change.token)
+        self.assertFalse(success)
+
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.email_verified)
+        self.assertTrue(self.user.check_password("TestPass123!"))
+        self.assertNotEqual(self.user.email, "raced@example.com")
+
+    def test_confirm_password_reset_unknown_token_skips_hashing(self):
+        """Test that a bogus reset token is rejected before hashing."""
+        with patch(
+            "apps.accounts.services.password_reset_service.make_password"
+        ) as make_password:
+            success, _ = PasswordResetService.confirm_password_reset(
+                str(uuid.uuid4()), "NewSecurePass123!"
+            )
+
+        self.assertFalse(success)
+        make_password.assert_not_called()
+
+    def test_confirm_email_change_rejects_stale_token(self):
+        """Test that a token is rejected after the email changed elsewhere."""
+        token = EmailChangeToken.objects.create(
+            user=self.user, new_email="new@example.com"
+        )
+        self.user.email = "other@example.com"
+        self.user.save(update_fields=["email"])
+
+        success, _ = EmailChangeService.confirm_email_change(token.token)
+
+        self.assertFalse(success)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "other@example.com")
+
+    def test_confirm_email_change_rechecks_email_in_update(self):
+        """Test that an email changed after validation blocks the change."""
+        token = EmailChangeToken.objects.create(
+            user=self.user, new_email="new@example.com"
+        )
+        original = EmailChangeToken.mark_as_used
+
+        def change_email_then_mark(instance):
+            # A concurrent request changes the email after valid() ran
+            User.objects.filter(pk=self.user.pk).update(email="other@example.com")
+            return original(instance)
+
+        with patch.object(EmailChangeToken, "mark_as_used", change_email_then_mark):
+            success, _ = EmailChangeService.confirm_email_change(token.token)
+
+        self.assertFalse(success)
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+        self.assertFalse(EmailChangeToken.objects.get(pk=token.pk).is_used)
+
+    def test_confirm_email_change_rejects_taken_email(self):
+        """Test that a token is rejected once the new email is taken."""
+        token = EmailChangeToken.objects.create(
+            user=self.user, new_email="taken@example.com"
+        )
+        UserFactory.create_customer(email="taken@example.com")
+
+        success, message = EmailChangeService.confirm_email_change(token.token)
+
+        self.assertFalse(success)
+        self.assertEqual(message, "This email is already in use by another account")
+        self.user.refresh_from_db()
+        self.assertNotEqual(self.user.email, "taken@example.com")
+        self.assertFalse(EmailChangeToken.objects.get(pk=token.pk).is_used)
+
+    def test_confirm_email_change(self):
+        """Test that a valid token changes the email."""
+        token = EmailChangeToken.objects.create(
+            user=self.user, new_email="new@example.com"
+        )
+
+        success, _ = EmailChangeService.confirm_email_change(token.token)
+
+        self.assertTrue(success)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "new@example.com")
+
+
+class RecordAuditLogTaskTest(TestCase):
+    """Test cases for audit log rows written by Celery."""
+
+    def test_transient_database_error_retried(self):
+        """Test that an OperationalError is retried and the row written once."""
+        user = UserFactory.create_customer()
+        bulk_create = AuditLog.objects.bulk_create
+        attempts = []
+
+        def flaky_bulk_create(objs, *args, **kwargs):
+            attempts.append(objs)
+            if len(attempts) == 1:
+                raise OperationalError("database is locked")
+            return bulk_create(objs, *args, **kwargs)
+
+        with patch.object(AuditLog.objects, "bulk_create", flaky_bulk_create):
+            record_audit_log_task.apply(
+                args=[user.pk, constants.AUDIT_ACTION_PROFILE_UPDATE], throw=False
+            )
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(
+            AuditLog.objects.get(user=user).action,
+            constants.AUDIT_ACTION_PROFILE_UPDATE,
+        )
+
+
+class PurgeExpiredTokensTaskTest(TestCase):
+    """Test cases for the scheduled token purge."""
+
+    def test_purges_every_token_table(self):
+        """Test that each token table is purged by its own subtask."""
+        user = UserFactory.create_customer()
+        expired = timezone.now() - timedelta(days=constants.TOKEN_RETENTION_DAYS + 1)
+        EmailVerificationToken.objects.create(user=user, expires_at=expired)
+        PasswordResetToken.objects.create(user=user, expires_at=expired)
+        EmailChangeToken.objects.create(
+            user=user, new_email="new@example.com", expires_at=expired
+        )
+        kept = PasswordResetToken.objects.create(user=user)
+
+        purge_expired_tokens_task()
+
+        self.assertFalse(EmailVerificationToken.objects.exists())
+        self.assertFalse(EmailChangeToken.objects.exists())
+        self.assertEqual(list(PasswordResetToken.objects.all()), [kept])
+
+
+class PurgeInactiveSessionsTaskTest(TestCase):
+    """Test cases for the scheduled session purge."""
+
+    def test_returns_number_of_sessions_deleted(self):
+        """Test that old revoked sessions are deleted and counted."""
+        user = UserFactory.create_customer()
+        user_agent = UserAgent.objects.intern("Test Agent")
+        UserSession.objects.create(
+            user=user, session_key="old", user_agent=user_agent, is_active=False
+        )
+        kept = UserSession.objects.create(
+            user=user, session_key="kept", user_agent=user_agent
+        )
+        UserSession.objects.update(
+            last_activity=timezone.now()
+            - timedelta(days=constants.SESSION_RETENTION_DAYS + 1)
+        )
+
+        self.assertEqual(purge_inactive_sessions_task(), 1)
+        self.assertEqual(list(UserSession.objects.all()), [kept])
@@ -46,6 +46,13 @@ class PasswordValidatorTest(TestCase):
         with self.assertRaises(ValidationError):
             validate_password_strength("SecurePass123")
 
+    def test_password_non_ascii_characters(self):
+        """Test that only ASCII letters count, but any decimal digit does."""
+        validate_password_strength("SecurePass٣!")
+
+        with self.assertRaises(ValidationError):
+            validate_password_strength("Écurepass123!")
+
 
 class PhoneValidatorTest(TestCase):
     """Test cases for phone number validation."""
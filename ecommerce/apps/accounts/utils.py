@@ -4,7 +4,8 @@ Utility Functions for Accounts App
 Reusable helper functions to avoid code duplication.
 """
 
-from typing import Optional
+from string import Formatter
+from typing import Any, Optional
 from django.http import HttpRequest
 from django.conf import settings
 
@@ -17,21 +18,32 @@ def get_client_ip(request: HttpRequest) -> Optional[str]:
     (indicating the app is behind a trusted proxy). Otherwise uses REMOTE_ADDR
     to prevent IP spoofing attacks.
 
+    The result is cached on the request, since login both records the
+    session and writes an audit entry from the same request.
+
     Args:
         request: HTTP request object
 
     Returns:
         Client IP address string or None if not available
     """
+    try:
+        return request._client_ip
+    except AttributeError:
+        pass
+
+    # Default: use REMOTE_ADDR (direct connection IP)
+    ip_address = request.META.get("REMOTE_ADDR")
+
     # Only trust X-Forwarded-For if behind a trusted proxy
     if getattr(settings, "USE_X_FORWARDED_HOST", False):
         x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
         if x_forwarded_for:
             # Take the first IP (client IP) from the chain
-            return x_forwarded_for.split(",")[0].strip()
+            ip_address = x_forwarded_for.partition(",")[0].strip()
 
-    # Default: use REMOTE_ADDR (direct connection IP)
-    return request.META.get("REMOTE_ADDR")
+    request._client_ip = ip_address
+    return ip_address
 
 
 def get_user_agent(request: HttpRequest) -> str:
@@ -45,3 +57,37 @@ def get_user_agent(request: HttpRequest) -> str:
         User agent string (empty string if not available)
     """
     return request.META.get("HTTP_USER_AGENT", "")
+
+
+class PrecompiledTemplate:
+    """
+    A str.format-style template parsed once instead of on every render.
+
+    Only plain ``{name}`` placeholders are supported; format specs and
+    conversions are rejected when the template is built.
+
+    Example:
+        greeting = PrecompiledTemplate("Hi {email}")
+        greeting.render(email="a@example.com")
+    """
+
+    def __init__(self, template: str):
+        self.parts = []
+        for literal, field, format_spec, conversion in Formatter().parse(template):
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported placeholder in template: {{{field}}}")
+            self.parts.append((literal, field))
+
+    def render(self, **context: Any) -> str:
+        """
+        Substitute placeholders with values from context.
+
+        Raises:
+            KeyError: If a placeholder has no value in context
+        """
+        chunks = []
+        for literal, field in self.parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(str(context[field]))
+        return "".join(chunks)
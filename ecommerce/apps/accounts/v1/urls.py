@@ -102,12 +102,12 @@ email_change_patterns = [
     ),
 ]
 
-# Combine all patterns
-urlpatterns = (
-    auth_patterns
-    + profile_patterns
-    + email_patterns
-    + session_patterns
-    + password_reset_patterns
-    + email_change_patterns
-)
+# Combine all patterns into one list (no intermediate concatenations)
+urlpatterns = [
+    *auth_patterns,
+    *profile_patterns,
+    *email_patterns,
+    *session_patterns,
+    *password_reset_patterns,
+    *email_change_patterns,
+]
@@ -6,12 +6,48 @@ Separated from field definitions for better organization and reusability.
 """
 
 import re
+import string
 from typing import Any
 import phonenumbers
 from django.core.exceptions import ValidationError
 from apps.common import constants as common_constants
 from apps.accounts import constants
 
+# Compiled once at import; validators run on every registration and password change
+# GST: 2-digit state code, PAN (10 alphanumeric), entity (1), Z (1), checksum (1)
+_GST_RE = re.compile(r"^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}$")
+
+# Password character classes, as bits of the mask from _password_char_classes
+_UPPERCASE = 1
+_LOWERCASE = 2
+_DIGIT = 4
+_SPECIAL = 8
+_ALL_CLASSES = _UPPERCASE | _LOWERCASE | _DIGIT | _SPECIAL
+_CHAR_CLASSES = {
+    **dict.fromkeys(string.ascii_uppercase, _UPPERCASE),
+    **dict.fromkeys(string.ascii_lowercase, _LOWERCASE),
+    **dict.fromkeys(string.digits, _DIGIT),
+    **dict.fromkeys('!@#$%^&*(),.?":{}|<>', _SPECIAL),
+}
+
+
+def _password_char_classes(value: str) -> int:
+    """
+    Find which character classes a password contains, in a single pass.
+
+    Letters count only if ASCII (like [A-Z] and [a-z]), while any Unicode
+    decimal digit counts as a digit (like \\d).
+
+    Returns:
+        Bitmask of _UPPERCASE, _LOWERCASE, _DIGIT and _SPECIAL
+    """
+    found = 0
+    for char in value:
+        found |= _CHAR_CLASSES.get(char, 0) or (_DIGIT if char.isdecimal() else 0)
+        if found == _ALL_CLASSES:
+            break
+    return found
+
 
 def validate_phone_number(value: str) -> None:
     """
@@ -66,9 +102,7 @@ def validate_gst_number(value: str) -> None:
             constants.GST_LENGTH_ERROR.format(length=constants.GST_NUMBER_LENGTH)
         )
 
-    # GST format validation: 2-digit state code, PAN (10 alphanumeric), entity (1), Z (1), checksum (1)
-    gst_pattern = r"^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}$"
-    if not re.match(gst_pattern, value.upper()):
+    if not _GST_RE.match(value.upper()):
         raise ValidationError(
             "Invalid GST number format. Expected format: 22AAAAA0000A1Z5"
         )
@@ -85,6 +119,7 @@ def validate_password_strength(value: str) -> None:
         ValidationError: If password doesn't meet requirements
     """
     errors = []
+    char_classes = _password_char_classes(value)
 
     # Check minimum length
     if len(value) < common_constants.PASSWORD_MIN_LENGTH:
@@ -93,19 +128,19 @@ def validate_password_strength(value: str) -> None:
         )
 
     # Check for uppercase
-    if not re.search(r"[A-Z]", value):
+    if not char_classes & _UPPERCASE:
         errors.append("Password must contain at least one uppercase letter")
 
     # Check for lowercase
-    if not re.search(r"[a-z]", value):
+    if not char_classes & _LOWERCASE:
         errors.append("Password must contain at least one lowercase letter")
 
     # Check for digit
-    if not re.search(r"\d", value):
+    if not char_classes & _DIGIT:
         errors.append("Password must contain at least one digit")
 
     # Check for special character
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', value):
+    if not char_classes & _SPECIAL:
         errors.append(
             'Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)'
         )
@@ -175,6 +210,7 @@ class EnhancedPasswordValidator:
         Uses instance configuration instead of delegating to validate_password_strength.
         """
         errors = []
+        char_classes = _password_char_classes(password)
 
         # Check minimum length
         if len(password) < self.min_length:
@@ -183,19 +219,19 @@ class EnhancedPasswordValidator:
             )
 
         # Check for uppercase (if required)
-        if self.require_uppercase and not re.search(r"[A-Z]", password):
+        if self.require_uppercase and not char_classes & _UPPERCASE:
             errors.append("Password must contain at least one uppercase letter")
 
         # Check for lowercase (if required)
-        if self.require_lowercase and not re.search(r"[a-z]", password):
+        if self.require_lowercase and not char_classes & _LOWERCASE:
             errors.append("Password must contain at least one lowercase letter")
 
         # Check for digit (if required)
-        if self.require_digit and not re.search(r"\d", password):
+        if self.require_digit and not char_classes & _DIGIT:
             errors.append("Password must contain at least one digit")
 
         # Check for special character (if required)
-        if self.require_special and not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if self.require_special and not char_classes & _SPECIAL:
             errors.append(
                 'Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)'
             )
@@ -144,12 +144,20 @@ class LoginView(TokenObtainPairView):
         from apps.accounts.models import User
 
         try:
-            user = User.objects.get(id=user_id)
+            user = User.objects.light().get(id=user_id)
         except User.DoesNotExist:
             return response
 
-        # Create session atomically (handles limit enforcement internally)
-        session, tokens = AuthService.create_session(user, request)
+        # Create session atomically (handles limit enforcement internally),
+        # keyed to the tokens the serializer already signed
+        session, tokens = AuthService.create_session(
+            user,
+            request,
+            tokens={
+                "refresh": response.data["refresh"],
+                "access": response.data["access"],
+            },
+        )
 
         # Log successful login
         AuditService.log_login(user, request)
@@ -50,7 +50,7 @@ class ResendVerificationEmailView(APIView):
         email = serializer.validated_data["email"]
 
         try:
-            user = User.objects.get(email=email.lower())
+            user = User.objects.light().get(email=email.lower())
             success, message = EmailService.resend_verification_email(user)
 
             if success:
@@ -14,6 +14,12 @@ from apps.accounts.serializers.profile import (
 from apps.accounts.models import User
 from apps.accounts.services import AuditService
 
+# Update serializer per role; anything else falls back to the customer one
+ROLE_SERIALIZER_CLASSES = {
+    User.Role.ADMIN: AdminProfileSerializer,
+    User.Role.SHOPKEEPER: ShopKeeperProfileSerializer,
+}
+
 
 class ProfileView(generics.RetrieveUpdateAPIView):
     """
@@ -21,6 +27,7 @@ class ProfileView(generics.RetrieveUpdateAPIView):
 
     GET /api/v1/accounts/profile/
     Returns user data with nested profile based on role.
+    Pass ?addresses=false to skip loading and serializing addresses.
 
     PATCH/PUT /api/v1/accounts/profile/
     Update user and profile data.
@@ -30,24 +37,38 @@ class ProfileView(generics.RetrieveUpdateAPIView):
 
     def get_serializer_class(self):
         """Return appropriate serializer based on user role"""
-        user = self.request.user
-        if user.role == User.Role.ADMIN:
-            return AdminProfileSerializer
-        elif user.role == User.Role.SHOPKEEPER:
-            return ShopKeeperProfileSerializer
-        return CustomerProfileSerializer
+        return ROLE_SERIALIZER_CLASSES.get(
+            self.request.user.role, CustomerProfileSerializer
+        )
+
+    def include_addresses(self):
+        """Whether the client wants addresses in the response"""
+        return self.request.query_params.get("addresses", "").lower() != "false"
+
+    def get_serializer_context(self):
+        """Tell the serializer whether to render addresses"""
+        context = super().get_serializer_context()
+        context["include_addresses"] = self.include_addresses()
+        return context
 
     def get_object(self):
-        """Return the user object (not profile)"""
-        return self.request.user
+        """Return the user object (not profile), with its profile and addresses"""
+        queryset = User.objects.light().filter(pk=self.request.user.pk)
+        return (
+            self.get_serializer_class()
+            .setup_eager_loading(queryset, include_addresses=self.include_addresses())
+            .get()
+        )
 
     def perform_update(self, serializer):
         """Save update and log to audit"""
+        # Read before save(); update() pops the profile-only fields
+        updated_fields = list(serializer.validated_data)
         user = serializer.save()
 
         # Log profile update
         AuditService.log_profile_update(
             user=user,
             request=self.request,
-            metadata={"updated_fields": list(serializer.validated_data.keys())},
+            changes={"updated_fields": updated_fields},
         )
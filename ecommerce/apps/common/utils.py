@@ -1 +1,151 @@
-# Common Utils file for Future Usecase!
+"""
+Common Utilities
+
+Helpers shared across apps.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterable, List, Tuple
+from django.db import connections, transaction
+from django.db.models import QuerySet
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the right-hand edge of the btree index instead of on a
+    random page. Use for primary keys only; secret tokens must stay uuid4.
+
+    Returns:
+        A new version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | rand
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def supports_update_returning(connection) -> bool:
+    """
+    Whether a connection's UPDATE statement accepts a RETURNING clause.
+
+    PostgreSQL always does; SQLite only from 3.35. Django's feature flags
+    describe INSERT ... RETURNING, which says nothing about UPDATE.
+    """
+    if connection.vendor == "postgresql":
+        return True
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35)
+    return False
+
+
+def update_returning(
+    queryset: QuerySet, fields: Iterable[str], **values: Any
+) -> List[Tuple]:
+    """
+    Update rows matched by a queryset and return columns of the updated rows.
+
+    Equivalent to ``queryset.update(**values)`` but also returns the requested
+    fields of every updated row, so callers can audit or notify without a
+    second SELECT. On PostgreSQL and SQLite 3.35+ this is a single
+    ``UPDATE ... RETURNING`` statement; other backends read the rows first
+    inside a transaction.
+
+    Args:
+        queryset: Rows to update
+        fields: Field names to return for each updated row ("pk" allowed)
+        **values: Field values to set, as for QuerySet.update()
+
+    Returns:
+        List of tuples, one per updated row, in ``fields`` order
+    """
+    model = queryset.model
+    opts = model._meta
+    fields = tuple(fields)
+    connection = connections[queryset.db]
+
+    if not supports_update_returning(connection):
+        with transaction.atomic(using=queryset.db):
+            rows = list(queryset.values_list("pk", *fields))
+            model._base_manager.using(queryset.db).filter(
+                pk__in=[row[0] for row in rows]
+            ).update(**values)
+        return [row[1:] for row in rows]
+
+    quote = connection.ops.quote_name
+    returned = [opts.pk if name == "pk" else opts.get_field(name) for name in fields]
+
+    assignments, params = [], []
+    for name, value in values.items():
+        field = opts.get_field(name)
+        assignments.append(f"{quote(field.column)} = %s")
+        params.append(field.get_db_prep_save(value, connection))
+
+    subquery, subquery_params = (
+        queryset.order_by().values("pk").query.get_compiler(queryset.db).as_sql()
+    )
+    sql = (
+        f"UPDATE {quote(opts.db_table)} SET {', '.join(assignments)} "
+        f"WHERE {quote(opts.pk.column)} IN ({subquery}) "
+        f"RETURNING {', '.join(quote(field.column) for field in returned)}"
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, *subquery_params])
+        rows = cursor.fetchall()
+
+    # Apply the same backend and field converters the ORM runs on SELECT
+    # results (e.g. SQLite returns UUIDs as hex and booleans as integers)
+    columns = [field.get_col(opts.db_table) for field in returned]
+    converters = [
+        connection.ops.get_db_converters(col) + col.get_db_converters(connection)
+        for col in columns
+    ]
+    results = []
+    for row in rows:
+        converted = []
+        for value, col, col_converters in zip(row, columns, converters):
+            for converter in col_converters:
+                value = converter(value, col, connection)
+            converted.append(value)
+        results.append(tuple(converted))
+    return results
+
+
+def start_queue_logging(logger_name: str) -> None:
+    """
+    Move a logger's handlers onto a background thread.
+
+    The logger's configured handlers are handed to a QueueListener and
+    replaced by a single QueueHandler, so the calling thread only enqueues
+    the record and file writes (and rotation) happen off the request path.
+    Forked children (Celery prefork workers) start their own listener.
+
+    Args:
+        logger_name: Name of a logger already configured by LOGGING
+    """
+    logger = logging.getLogger(logger_name)
+    handlers = logger.handlers
+    if not handlers or any(isinstance(h, QueueHandler) for h in handlers):
+        return
+
+    log_queue = queue.SimpleQueue()
+
+    def start_listener():
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+    logger.handlers = [QueueHandler(log_queue)]
+    start_listener()
+    os.register_at_fork(after_in_child=start_listener)
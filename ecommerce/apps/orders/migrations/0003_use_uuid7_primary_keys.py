@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-16 10:05
+
+import apps.common.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0002_returnrequest"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="returnrequest",
+            name="id",
+            field=models.UUIDField(
+                default=apps.common.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -4,8 +4,8 @@ Return Request Model
 Tracks customer return requests for delivered orders.
 """
 
-import uuid
 from django.db import models
+from apps.common.utils import uuid7
 from apps.common.models import TimeStampedModel
 
 
@@ -31,7 +31,7 @@ class ReturnRequest(TimeStampedModel):
         CHANGED_MIND = "CHANGED_MIND", "Changed Mind"
         OTHER = "OTHER", "Other"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     order = models.OneToOneField(
         "orders.Order",
         on_delete=models.CASCADE,
@@ -61,11 +61,12 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.accounts.middleware.AuditLogBufferMiddleware",
 ]
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.LightJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
@@ -114,6 +115,11 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database defaults
 DATABASES = {"default": env.db("DATABASE_URL")}
 
+# Keep connections open across requests instead of reconnecting (and
+# re-doing the TLS handshake) for every one; health checks drop dead ones
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=600)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -151,6 +157,33 @@ DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL")
 # Frontend URL
 FRONTEND_URL = env("FRONTEND_URL")
 
+# Cache: Redis when REDIS_URL is set, per-process memory otherwise
+REDIS_URL = env("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
+# Celery (background tasks)
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="redis://localhost:6379/1")
+CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=False)
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_ACKS_LATE = True
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    "purge-expired-tokens": {
+        "task": "apps.accounts.tasks.purge_expired_tokens_task",
+        "schedule": 60 * 60,  # hourly
+    },
+    "purge-inactive-sessions": {
+        "task": "apps.accounts.tasks.purge_inactive_sessions_task",
+        "schedule": 60 * 60,  # hourly
+    },
+}
+
 # Phone Number Settings
 PHONENUMBER_DEFAULT_REGION = "IN"
 PHONENUMBER_DB_FORMAT = "E164"
@@ -16,6 +16,11 @@ DEFAULT_FROM_EMAIL = "noreply@ecommerce.com"
 # Frontend URL for email verification links (for local dev)
 FRONTEND_URL = "http://localhost:3000"
 
+# Run Celery tasks inline unless a broker/worker is explicitly configured
+CELERY_TASK_ALWAYS_EAGER = env.bool(  # noqa: F405
+    "CELERY_TASK_ALWAYS_EAGER", default=True
+)
+
 # =============================================================================
 # Django Silk - SQL Query & Performance Profiling (Optional)
 # Access at: http://127.0.0.1:8000/silk/
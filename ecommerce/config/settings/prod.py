@@ -19,8 +19,18 @@ ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])
 
-# Use more secure DB engine in production like PostgreSQL
-DATABASES = {"default": env.db("DATABASE_URL")}
+# SECURITY: Required shared cache - session counts, throttles and used-token
+# markers must be seen by every worker, not kept in per-process memory
+REDIS_URL = env("REDIS_URL")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+}
+
+# Use more secure DB engine in production like PostgreSQL; DATABASES
+# (with persistent connections) comes from base via DATABASE_URL
 
 # Production security headers
 SECURE_SSL_REDIRECT = env.bool("DJANGO_SECURE_SSL_REDIRECT", default=True)
@@ -7,6 +7,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    # Tests default to the test settings (fast password hasher, in-memory DB)
+    if sys.argv[1:2] == ["test"]:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
     try:
         from django.core.management import execute_from_command_line